@@ -1,6 +1,7 @@
 """Configuration constants for the application."""
 
 import os
+from types import MappingProxyType
 
 from app.core.utils import parse_bool
 
@@ -119,7 +120,7 @@ CAMERA_TASKS = [
 ] + MODEL_CLASSES
 UI_CAMERA_TASKS = ["in_out_counting", "visitor_mgmt"] + PPE_TASKS
 
-CONFIG_DEFAULTS = {
+_CONFIG_DEFAULTS = {
     "track_ppe": [],
     "alert_anomalies": [],
     "track_objects": ["person", "vehicle"],
@@ -179,6 +180,9 @@ CONFIG_DEFAULTS = {
     ],
     "settings_password": "000",
 }
+# read-only view so callers can't mutate the shared defaults in place;
+# storage._apply_defaults copies the mutable values it hands out
+CONFIG_DEFAULTS = MappingProxyType(_CONFIG_DEFAULTS)
 
 BRANDING_DEFAULTS = {
     "company_name": "My Company",
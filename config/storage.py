@@ -7,7 +7,9 @@ import json
 import os
 import tempfile
 import threading
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import redis
@@ -57,10 +59,9 @@ def _read_config_file(path: str) -> dict:
 def _apply_defaults(data: dict) -> dict:
     """Populate missing configuration keys and normalize fields."""
     for key, value in CONFIG_DEFAULTS.items():
-        if isinstance(value, (dict, list)):
-            data.setdefault(key, copy.deepcopy(value))
-        else:
-            data.setdefault(key, value)
+        # only copy mutable defaults for keys that are actually missing
+        if key not in data:
+            data[key] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
     raw_ppe = data.get("track_ppe", [])
     data["track_ppe"] = _sanitize_track_ppe(raw_ppe)
     data.setdefault("stream_mode", "ffmpeg")
@@ -99,7 +100,7 @@ def _rewrite_pipelines(data: dict) -> None:
 def _load_branding_file(path: str) -> dict:
     """Load branding information from ``path``."""
 
-    return load_branding(path)
+    return dict(load_branding(path))
 
 
 def _persist_to_redis(data: dict, redis_client: redis.Redis | None) -> None:
@@ -224,16 +225,33 @@ def save_config(cfg: dict, path: str, r: redis.Redis) -> None:
         r.set("config", json.dumps(cfg, default=_ser))
 
 
-def load_branding(path: str) -> dict:
-    """Load branding configuration from a JSON file."""
-    if os.path.exists(path):
+@lru_cache(maxsize=32)
+def _load_branding_cached(
+    path: str, stamp: tuple[int, int, int] | None
+) -> MappingProxyType[str, Any]:
+    """Parse ``path`` once per stat stamp; a ``None`` stamp means missing."""
+    if stamp is not None:
         with open(path) as f:
             data = json.load(f)
     else:
         data = {}
     for k, v in BRANDING_DEFAULTS.items():
         data.setdefault(k, v)
-    return data
+    return MappingProxyType(data)
+
+
+def load_branding(path: str) -> MappingProxyType[str, Any]:
+    """Load branding configuration from a JSON file.
+
+    The result is a shared read-only view; copy it before making changes.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        stamp = None
+    else:
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    return _load_branding_cached(path, stamp)
 
 
 def save_branding(data: dict, path: str) -> None:
@@ -38,6 +38,8 @@ class CameraManager:
         self.start_tracker_fn = start_fn
         self.stop_tracker_fn = stop_fn
         self._state: Dict[int, RetryState] = {}
+        # serialise start/restart per camera so concurrent callers share one launch
+        self._start_locks: Dict[int, asyncio.Lock] = {}
         self._latest_frames: Dict[int, Dict[str, object]] = {}
         self._latest_lock = asyncio.Lock()
         try:
@@ -96,6 +98,15 @@ class CameraManager:
             "counting": any(t in cam.get("tasks", []) for t in ("in_count", "out_count")),
         }
 
+    def _write_status(self, cam_id: int, status: str) -> None:
+        """Set ``status`` on the camera record and its health hash in one round-trip."""
+        if not self.redis:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(f"camera:{cam_id}:health", mapping={"status": status})
+        pipe.hset(f"camera:{cam_id}", "status", status)
+        pipe.execute()
+
     async def _start_tracker_background(self, cam: dict) -> None:
         """Launch tracker start in a background thread and update status."""
         start = asyncio.get_event_loop().time()
@@ -108,15 +119,11 @@ class CameraManager:
                 self.redis,
                 self.update_latest_frame,
             )
-            if self.redis:
-                status = "online" if tr and getattr(tr, "online", False) else "offline"
-                self.redis.hset(f"camera:{cam.get('id')}:health", mapping={"status": status})
-                self.redis.hset(f"camera:{cam.get('id')}", "status", status)
+            status = "online" if tr and getattr(tr, "online", False) else "offline"
+            self._write_status(cam.get("id"), status)
         except Exception:
             logger.exception(f"[{cam.get('id')}] tracker start failed")
-            if self.redis:
-                self.redis.hset(f"camera:{cam.get('id')}:health", mapping={"status": "offline"})
-                self.redis.hset(f"camera:{cam.get('id')}", "status", "offline")
+            self._write_status(cam.get("id"), "offline")
             raise
         else:
             duration = asyncio.get_event_loop().time() - start
@@ -132,11 +139,15 @@ class CameraManager:
             f"[proc:{camera_id}] start type={cam.get('type')} "
             f"transport={cam.get('rtsp_transport')} flags={flags}"
         )
-        try:
-            await self._attempt_start(cam)
-        except Exception:
-            logger.exception(f"[proc:{camera_id}] tracker start failed")
-            raise
+        async with self._start_locks.setdefault(camera_id, asyncio.Lock()):
+            if camera_id in self.trackers:
+                logger.debug(f"[proc:{camera_id}] tracker already running")
+                return
+            try:
+                await self._attempt_start(cam)
+            except Exception:
+                logger.exception(f"[proc:{camera_id}] tracker start failed")
+                raise
 
     async def restart(self, camera_id: int) -> None:
         cam = self._find_cam(camera_id)
@@ -148,19 +159,20 @@ class CameraManager:
             f"transport={cam.get('rtsp_transport')} flags={flags}"
         )
 
-        try:
-            await asyncio.to_thread(self.stop_tracker_fn, camera_id, self.trackers)
-        except Exception:
-            logger.exception(f"[proc:{camera_id}] tracker stop failed")
-            raise
-
-        if cam.get("enabled", True) and self.cfg.get("enable_person_tracking", True):
+        async with self._start_locks.setdefault(camera_id, asyncio.Lock()):
             try:
-                await self._attempt_start(cam)
+                await asyncio.to_thread(self.stop_tracker_fn, camera_id, self.trackers)
             except Exception:
-                logger.exception(f"[proc:{camera_id}] tracker start failed")
+                logger.exception(f"[proc:{camera_id}] tracker stop failed")
                 raise
 
+            if cam.get("enabled", True) and self.cfg.get("enable_person_tracking", True):
+                try:
+                    await self._attempt_start(cam)
+                except Exception:
+                    logger.exception(f"[proc:{camera_id}] tracker start failed")
+                    raise
+
     def refresh_flags(self, camera_id: int) -> None:
         tr = self.trackers.get(camera_id)
         if tr:
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import time
 from datetime import datetime
 from typing import Dict
 
+import orjson
 import redis
 from loguru import logger
 
@@ -14,6 +14,8 @@ from config import ANOMALY_ITEMS, COUNT_GROUPS, config
 from modules.events_store import RedisStore
 from utils.logx import event, every, on_change
 
+ANOMALY_COUNT_KEYS = tuple(f"{item}_count" for item in ANOMALY_ITEMS)
+
 
 # gather_stats routine
 def gather_stats(trackers: Dict[int, "PersonTracker"], r: redis.Redis, store: RedisStore) -> dict:
@@ -44,8 +46,7 @@ def gather_stats(trackers: Dict[int, "PersonTracker"], r: redis.Redis, store: Re
         group_counts[g] = {"in": in_c, "out": out_c, "current": in_c - out_c}
     total_in = sum(gv["in"] for gv in group_counts.values())
     total_out = sum(gv["out"] for gv in group_counts.values())
-    count_keys = [f"{item}_count" for item in ANOMALY_ITEMS]
-    count_vals = r.mget(count_keys)
+    count_vals = r.mget(ANOMALY_COUNT_KEYS)
     anomaly_counts = {
         item: int(val or 0) for item, val in zip(ANOMALY_ITEMS, count_vals, strict=False)
     }
@@ -99,13 +100,13 @@ def broadcast_stats(
     existing: dict = {}
     for k, v in raw_totals.items():
         key = k.decode() if isinstance(k, (bytes, bytearray)) else k
-        val = v.decode() if isinstance(v, (bytes, bytearray)) else v
         if key in {"anomaly_counts", "group_counts"}:
             try:
-                existing[key] = json.loads(val)
+                existing[key] = orjson.loads(v)
             except Exception:  # pragma: no cover - corrupt data
                 existing[key] = {}
         else:
+            val = v.decode() if isinstance(v, (bytes, bytearray)) else v
             try:
                 existing[key] = int(val)
             except (TypeError, ValueError):
@@ -120,7 +121,8 @@ def broadcast_stats(
     ):
         return
 
-    payload = json.dumps(data)
+    # published on every change; capture.first_frame_ms is keyed by int camera id
+    payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
     r.publish("stats_updates", payload)
     try:
         r.hset(
@@ -131,8 +133,8 @@ def broadcast_stats(
                 "current": data["current"],
                 "max_capacity": data["max_capacity"],
                 "status": data["status"],
-                "anomaly_counts": json.dumps(data["anomaly_counts"]),
-                "group_counts": json.dumps(data["group_counts"]),
+                "anomaly_counts": orjson.dumps(data["anomaly_counts"]),
+                "group_counts": orjson.dumps(data["group_counts"]),
             },
         )
         r.xadd("stats_stream", {"data": payload}, maxlen=1, approximate=False)
@@ -9,6 +9,7 @@ import time
 from datetime import date
 from typing import Any, Dict, List
 
+import orjson
 import psutil
 import redis
 from loguru import logger
@@ -21,7 +22,7 @@ from modules import camera_factory
 from modules.tracker import PersonTracker
 from utils import logx
 from utils.housekeeping import housekeeping
-from utils.redis import get_sync_client, trim_sorted_set_sync
+from utils.redis import get_sync_client, incr_ppe_count, record_ppe_log, trim_sorted_set_sync
 
 lock = threading.Lock()
 
@@ -42,6 +43,10 @@ def _persist_watchdog(cam_id: int, **fields: Any) -> None:
         pass
 
 
+def _decode(val: Any) -> Any:
+    return val.decode() if isinstance(val, bytes) else val
+
+
 # _apply_counter_config routine
 def _apply_counter_config(cam_id: int, r: redis.Redis, trackers: Dict[int, PersonTracker]) -> None:
     tr = trackers.get(cam_id)
@@ -53,14 +58,14 @@ def _apply_counter_config(cam_id: int, r: redis.Redis, trackers: Dict[int, Perso
     except Exception:
         data = {}
     if data:
+        # raw clients reply with bytes, decode_responses clients with str
+        data = {_decode(k): _decode(v) for k, v in data.items()}
         try:
-            x1 = float(data.get(b"x1", 0.0))
-            y1 = float(data.get(b"y1", 0.0))
-            x2 = float(data.get(b"x2", 1.0))
-            y2 = float(data.get(b"y2", 1.0))
-            ori_val: Any = data.get(b"orientation", tr.line_orientation)
-            if isinstance(ori_val, bytes):
-                ori_val = ori_val.decode()
+            x1 = float(data.get("x1", 0.0))
+            y1 = float(data.get("y1", 0.0))
+            x2 = float(data.get("x2", 1.0))
+            y2 = float(data.get("y2", 1.0))
+            ori_val: Any = data.get("orientation", tr.line_orientation)
             ratio = (x1 + x2) / 2 if ori_val == "vertical" else (y1 + y2) / 2
             update["line_ratio"] = ratio
             update["line_orientation"] = ori_val
@@ -87,9 +92,20 @@ def _apply_counter_config(cam_id: int, r: redis.Redis, trackers: Dict[int, Perso
     tr.update_cfg(update)
 
 
-async def counter_config_listener(r: redis.Redis, trackers: Dict[int, PersonTracker]) -> None:
+async def counter_config_listener(
+    r: redis.Redis,
+    trackers: Dict[int, PersonTracker],
+    ready: asyncio.Event | None = None,
+) -> None:
+    """Apply ``counter.config`` updates to running trackers.
+
+    ``ready`` is set once the subscription is in place, so callers can publish
+    without racing the listener.
+    """
     pubsub = r.pubsub(ignore_subscribe_messages=True)
     pubsub.subscribe("counter.config")
+    if ready is not None:
+        ready.set()
     try:
         while True:
             msg = await asyncio.to_thread(pubsub.get_message, timeout=1.0)
@@ -172,7 +188,8 @@ def load_cameras(r: redis.Redis, default_url: str) -> List[dict]:
 
 # save_cameras routine
 def save_cameras(cams: List[dict], r: redis.Redis) -> None:
-    data = json.dumps(cams)
+    # called on every camera edit with the full list; orjson keeps the re-encode cheap
+    data = orjson.dumps(cams, option=orjson.OPT_NON_STR_KEYS)
     if hasattr(r, "set"):
         r.set("cameras", data)
     else:
@@ -347,12 +364,17 @@ def stop_tracker(cam_id: int, trackers: Dict[int, PersonTracker]) -> None:
 
 # reset_counts routine
 def reset_counts(trackers: Dict[int, PersonTracker]) -> None:
+    # trackers normally share one client, so this is usually a single MSET
+    writes: dict[int, tuple[redis.Redis, dict[str, Any]]] = {}
     for tr in trackers.values():
         tr.in_count = 0
         tr.out_count = 0
         tr.tracks.clear()
         tr.prev_date = date.today()
-        tr.redis.mset({tr.key_in: 0, tr.key_out: 0, tr.key_date: tr.prev_date.isoformat()})
+        _, mapping = writes.setdefault(id(tr.redis), (tr.redis, {}))
+        mapping.update({tr.key_in: 0, tr.key_out: 0, tr.key_date: tr.prev_date.isoformat()})
+    for client, mapping in writes.values():
+        client.mset(mapping)
     logger.info("Counts reset")
 
 
@@ -366,9 +388,11 @@ def log_counts(r: redis.Redis, trackers: Dict[int, PersonTracker]) -> None:
         data[f"in_{g}"] = in_c
         data[f"out_{g}"] = out_c
     entry = json.dumps(data)
-    r.zadd("history", {entry: ts})
-    trim_sorted_set_sync(r, "history", ts)
-    r.zremrangebyrank("history", 0, -10001)
+    pipe = r.pipeline(transaction=False)
+    pipe.zadd("history", {entry: ts})
+    trim_sorted_set_sync(pipe, "history", ts)
+    pipe.zremrangebyrank("history", 0, -10001)
+    pipe.execute()
     from modules.events_store import RedisStore
 
     from .stats import broadcast_stats
@@ -570,8 +594,7 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
             "color": None,
             "path": None,
         }
-        r.zadd("ppe_logs", {json.dumps(entry): ts})
-        r.incr("ppe_report_version")
+        raw = json.dumps(entry)
         cfg_data = r.get("config")
         limit = 1000
         retention_secs = 7 * 24 * 60 * 60
@@ -582,8 +605,9 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
                 retention_secs = int(cfg.get("ppe_log_retention_secs", retention_secs))
             except (json.JSONDecodeError, ValueError, TypeError):
                 pass
-        trim_sorted_set_sync(r, "ppe_logs", ts, retention_secs)
-        r.zremrangebyrank("ppe_logs", 0, -limit - 1)
+        record_ppe_log(r, raw, entry["status"], ts, retention_secs, limit)
+        incr_ppe_count(r, entry["status"], ts)
+        r.incr("ppe_report_version")
     elif status == "red":
         r.incr("red_alert_count")
         entry = {
@@ -595,8 +619,7 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
             "color": None,
             "path": None,
         }
-        r.zadd("ppe_logs", {json.dumps(entry): ts})
-        r.incr("ppe_report_version")
+        raw = json.dumps(entry)
         cfg_data = r.get("config")
         limit = 1000
         retention_secs = 7 * 24 * 60 * 60
@@ -607,5 +630,6 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
                 retention_secs = int(cfg.get("ppe_log_retention_secs", retention_secs))
             except (json.JSONDecodeError, ValueError, TypeError):
                 pass
-        trim_sorted_set_sync(r, "ppe_logs", ts, retention_secs)
-        r.zremrangebyrank("ppe_logs", 0, -limit - 1)
+        record_ppe_log(r, raw, entry["status"], ts, retention_secs, limit)
+        incr_ppe_count(r, entry["status"], ts)
+        r.incr("ppe_report_version")
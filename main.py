@@ -18,7 +18,7 @@ from server.config import _load_secret_key
 from server.startup import handle_unexpected_error
 from server.startup import init_app as _init_app
 from server.startup import lifespan
-from utils.redis import get_sync_client as _get_sync_client
+from utils import redis as redis_utils
 
 
 def init_app(
@@ -31,7 +31,8 @@ def init_app(
 
 def get_sync_client(url: str | None = None):
     """Expose sync Redis client for tests."""
-    return _get_sync_client(url)
+    # resolved per call so patching utils.redis.get_sync_client covers this too
+    return redis_utils.get_sync_client(url)
 
 
 try:  # pragma: no cover - middleware optional
@@ -22,6 +22,12 @@ class Transport(str, Enum):
     udp = "udp"
 
 
+# value -> member tables; unknown values fall through to the Enum call so
+# invalid records still raise ValueError
+_ORIENTATIONS = {e.value: e for e in Orientation}
+_TRANSPORTS = {e.value: e for e in Transport}
+
+
 @dataclass
 class Camera:
     id: str
@@ -75,8 +81,8 @@ def _deserialize(data: dict[str, Any]) -> Camera:
         type=data.get("type", "rtsp"),
         analytics=data.get("analytics") or {},
         line=data.get("line"),
-        orientation=Orientation(data["orientation"]),
-        transport=Transport(data["transport"]),
+        orientation=_ORIENTATIONS.get(data["orientation"]) or Orientation(data["orientation"]),
+        transport=_TRANSPORTS.get(data["transport"]) or Transport(data["transport"]),
         resolution=data.get("resolution"),
         reverse=data.get("reverse", False),
         show=data.get("show", False),
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import io
-import json
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from loguru import logger
 from openpyxl import Workbook
 from openpyxl.drawing.image import Image as XLImage
@@ -17,6 +17,14 @@ from redis.exceptions import RedisError
 from app.core.utils import mtime
 from core import events
 from modules.profiler import register_thread
+from utils.redis import (
+    PPE_COUNT_SINCE,
+    PPE_COUNT_TTL,
+    PPE_STATUS_SETS_READY,
+    backfill_ppe_status_sets,
+    ppe_count_key,
+    ppe_status_key,
+)
 
 from .email_utils import send_email
 
@@ -48,6 +56,10 @@ class AlertWorker:
         """Main worker loop that evaluates rules and reacts to events."""
         register_thread("Alerts")
         logger.info("AlertWorker started")
+        try:
+            backfill_ppe_status_sets(self.redis)
+        except RedisError as exc:
+            logger.warning("PPE status set backfill failed: {}", exc)
         try:
             with self.redis.pubsub() as pubsub:
                 pubsub.subscribe("events")
@@ -91,14 +103,31 @@ class AlertWorker:
         rows = []
         for item in entries:
             try:
-                e = json.loads(item if isinstance(item, str) else item.decode())
-            except json.JSONDecodeError:
+                e = orjson.loads(item)
+            except orjson.JSONDecodeError:
                 continue
             if filter_fn and not filter_fn(e):
                 continue
             rows.append(e)
         return rows
 
+    def _recent_count(self, status: str, start_ts: int, end_ts: int) -> int | None:
+        """Return an upper bound on ``status`` logs in the window, if counted.
+
+        Sums the per-minute buckets overlapping ``(start_ts, end_ts]``; a
+        missing bucket is a minute without logs. ``None`` means the window
+        reaches back before counting started or past the bucket TTL, so only
+        a row scan is reliable.
+        """
+        if end_ts - start_ts + 60 > PPE_COUNT_TTL:
+            return None
+        keys = [ppe_count_key(status, m) for m in range(start_ts // 60, end_ts // 60 + 1)]
+        since, *counts = self.redis.mget([PPE_COUNT_SINCE, *keys])
+        # the minute counting started in may also hold uncounted older logs
+        if since is None or start_ts // 60 <= int(since) // 60:
+            return None
+        return sum(int(c or 0) for c in counts)
+
     # _send_report routine
     def _send_report(self, rows, recipients, subject, attach=True):
         """Compile PPE log rows into a spreadsheet and email it."""
@@ -149,6 +178,7 @@ class AlertWorker:
         if not rules:
             return
         now = int(time.time())
+        status_sets_ready = self.redis.exists(PPE_STATUS_SETS_READY)
         for i, rule in enumerate(rules):
             metric = rule.get("metric")
             rtype = rule.get("type", "event")
@@ -160,12 +190,17 @@ class AlertWorker:
                 continue
             last_key = f"alert_rule_{i}_last"
             last_ts = int(float(self.redis.get(last_key) or 0))
-            if metric in events.ALL_EVENTS:
+            is_event = metric in events.ALL_EVENTS
+            if is_event:
                 fetch_rows = lambda s, e: self._collect_rows(
                     "events", s, e, lambda r: r.get("event") == metric
                 )
                 send_report = self._send_report
+            elif status_sets_ready:
+                fetch_rows = lambda s, e: self._collect_rows(ppe_status_key(metric), s, e)
+                send_report = self._send_report
             else:
+                # older logs have not been copied into the per-status sets yet
                 fetch_rows = lambda s, e: self._collect_rows(
                     "ppe_logs", s, e, lambda r: r.get("status") == metric
                 )
@@ -182,6 +217,10 @@ class AlertWorker:
                 if now - last_ts < window * 60:
                     continue
                 start = now - window * 60
+                if not is_event:
+                    count = self._recent_count(metric, start, now)
+                    if count is not None and count < value:
+                        continue
                 rows = fetch_rows(start, now)
                 if len(rows) >= value:
                     send_report(rows[:value], recipients, f"Alert: {metric}", attach)
@@ -3,7 +3,7 @@ from __future__ import annotations
 """Redis-backed store for tracking events."""
 
 import json
-from typing import Iterable
+from typing import Any, Iterable
 
 from loguru import logger
 from redis import Redis
@@ -22,6 +22,48 @@ VEHICLE_LABELS = {
 }
 
 
+def _event_keys(label: str) -> tuple[str, ...]:
+    """Return the sorted sets an event with ``label`` is written to."""
+    if label == "person":
+        return ("events", "person_logs")
+    if label == "vehicle" or label in VEHICLE_LABELS:
+        return ("events", "vehicle_logs")
+    return ("events",)
+
+
+def _event_entry(
+    *,
+    ts_utc: int,
+    ts_local: str,
+    camera_id: int,
+    camera_name: str,
+    track_id: int,
+    direction: str,
+    label: str,
+    image_path: str | None,
+    thumb_path: str | None,
+) -> dict[str, Any]:
+    """Return the stored form of one event."""
+    return {
+        "ts": ts_utc,
+        "ts_local": ts_local,
+        "cam_id": camera_id,
+        "camera_name": camera_name,
+        "track_id": track_id,
+        "direction": direction,
+        "label": label,
+        "image_path": image_path,
+        "thumb_path": thumb_path,
+    }
+
+
+def _add_event(client: Redis, entry: dict[str, Any]) -> None:
+    """Queue ``entry`` on every sorted set its label belongs to."""
+    raw = json.dumps(entry)
+    for key in _event_keys(entry["label"]):
+        client.zadd(key, {raw: entry["ts"]})
+
+
 class RedisStore:
     """Lightweight wrapper around Redis sorted sets for event data."""
 
@@ -43,27 +85,36 @@ class RedisStore:
         thumb_path: str | None,
     ) -> None:
         """Store an event entry in Redis sorted sets."""
-        entry = {
-            "ts": ts_utc,
-            "ts_local": ts_local,
-            "cam_id": camera_id,
-            "camera_name": camera_name,
-            "track_id": track_id,
-            "direction": direction,
-            "label": label,
-            "image_path": image_path,
-            "thumb_path": thumb_path,
-        }
-        raw = json.dumps(entry)
+        entry = _event_entry(
+            ts_utc=ts_utc,
+            ts_local=ts_local,
+            camera_id=camera_id,
+            camera_name=camera_name,
+            track_id=track_id,
+            direction=direction,
+            label=label,
+            image_path=image_path,
+            thumb_path=thumb_path,
+        )
         try:
-            self.r.zadd("events", {raw: ts_utc})
-            if label == "person":
-                self.r.zadd("person_logs", {raw: ts_utc})
-            elif label == "vehicle" or label in VEHICLE_LABELS:
-                self.r.zadd("vehicle_logs", {raw: ts_utc})
+            _add_event(self.r, entry)
         except RedisError as exc:
             logger.warning("failed to persist event: {}", exc)
 
+    # persist_events routine
+    def persist_events(self, events: Iterable[dict[str, Any]]) -> None:
+        """Store many events in one pipelined round trip.
+
+        Each item takes the same keyword arguments as :meth:`persist_event`.
+        """
+        pipe = self.r.pipeline(transaction=False)
+        for ev in events:
+            _add_event(pipe, _event_entry(**ev))
+        try:
+            pipe.execute()
+        except RedisError as exc:
+            logger.warning("failed to persist events: {}", exc)
+
     # fetch_events routine
     def fetch_events(self, start_ts: int, end_ts: int, *, label: str | None = None) -> list[str]:
         """Return raw event entries from Redis within the time range."""
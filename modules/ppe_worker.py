@@ -20,7 +20,7 @@ from core import events
 from modules.profiler import log_resource_usage, profile_predict, register_thread
 from utils import logx
 from utils.gpu import get_device
-from utils.redis import trim_sorted_set_sync
+from utils.redis import incr_ppe_count, record_ppe_log
 
 try:  # optional heavy dependency
     import torch  # type: ignore
@@ -91,9 +91,10 @@ def _log_status(redis, entry, status, conf, snap_dir) -> None:
         "conf": conf,
         "path": str(img_path.name) if path else "",
     }
-    redis.zadd("ppe_logs", {json.dumps(log): ts})
+    raw = json.dumps(log)
     retention = int(cfg.get("ppe_log_retention_secs", 0)) or None
-    trim_sorted_set_sync(redis, "ppe_logs", ts, retention)
+    record_ppe_log(redis, raw, status, ts, retention)
+    incr_ppe_count(redis, status, ts)
     redis.incr("ppe_report_version")
     if status.startswith("no_"):
         redis.incr(f"{status}_count")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from typing import AsyncIterator, Dict
 
@@ -53,12 +54,17 @@ class PreviewPublisher:
                     topic=f"frames:preview:{camera_id}",
                     seq=bus.seq,
                 )
-                jpeg = encode_jpeg(frame)
-                headers = (
-                    b"Content-Type: image/jpeg\r\n"
-                    + f"Content-Length: {len(jpeg)}\r\n\r\n".encode()
+                # encoders release the GIL; keep the event loop free while they run
+                jpeg = await asyncio.to_thread(encode_jpeg, frame)
+                yield b"".join(
+                    (
+                        boundary,
+                        b"\r\nContent-Type: image/jpeg\r\n",
+                        b"Content-Length: %d\r\n\r\n" % len(jpeg),
+                        jpeg,
+                        b"\r\n",
+                    )
                 )
-                yield boundary + b"\r\n" + headers + jpeg + b"\r\n"
         finally:
             self._clients[camera_id] -= 1
             logx.event("PREVIEW_CLIENT_CLOSE", camera_id=camera_id)
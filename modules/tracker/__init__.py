@@ -2,6 +2,7 @@
 
 from .detector import Detector
 from .manager import InferWorker, PersonTracker, PostProcessWorker, ProcessingWorker
+from .spsc import SPSCQueue
 from .stream import CaptureWorker
 from .tracker import Tracker
 
@@ -50,5 +51,6 @@ __all__ = [
     "CaptureWorker",
     "Detector",
     "Tracker",
+    "SPSCQueue",
     "tracker",
 ]
@@ -34,6 +34,7 @@ from utils.time import format_ts
 from ..duplicate_filter import DuplicateFilter
 from ..utils import SNAP_DIR, lock
 from .detector import Detector
+from .spsc import SPSCQueue
 from .stream import CaptureWorker
 from .tracker import Tracker
 
@@ -647,9 +648,9 @@ class PersonTracker:
         self.detector = Detector(self.model_person, self.device)
         self.batch_size = max(2, min(int(cfg.get("batch_size", 2)), 4))
         qsize = cfg.get("queue_size", 10)
-        self.frame_queue = queue.Queue(maxsize=qsize)
-        self.det_queue = queue.Queue(maxsize=qsize)
-        self.out_queue = queue.Queue(maxsize=qsize)
+        self.frame_queue = SPSCQueue(maxsize=qsize)
+        self.det_queue = SPSCQueue(maxsize=qsize)
+        self.out_queue = SPSCQueue(maxsize=qsize)
         log_mem("Before loading plate model")
         try:
             start = time.perf_counter()
@@ -0,0 +1,68 @@
+"""Bounded single-producer/single-consumer queue for tracker stages."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import deque
+from typing import Any
+
+
+class SPSCQueue:
+    """Drop-in replacement for :class:`queue.Queue` between two threads.
+
+    ``queue.Queue`` maintains three conditions plus unfinished-task
+    bookkeeping for ``join``.  The tracker stages only ever have one producer
+    and one consumer, so a ``deque`` guarded by a single ``Condition`` is
+    enough.  ``queue.Empty`` and ``queue.Full`` are raised as usual so callers
+    keep their existing error handling.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._items: deque[Any] = deque()
+        self._cv = threading.Condition(threading.Lock())
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        with self._cv:
+            if self.full():
+                if not block:
+                    raise queue.Full
+                if not self._wait(lambda: not self.full(), timeout):
+                    raise queue.Full
+            self._items.append(item)
+            self._cv.notify()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        with self._cv:
+            if not self._items:
+                if not block:
+                    raise queue.Empty
+                if not self._wait(lambda: bool(self._items), timeout):
+                    raise queue.Empty
+            item = self._items.popleft()
+            self._cv.notify()
+            return item
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def _wait(self, predicate, timeout: float | None) -> bool:
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        return self._cv.wait_for(predicate, timeout)
+
+
+__all__ = ["SPSCQueue"]
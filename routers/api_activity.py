@@ -15,12 +15,32 @@ router = APIRouter()
 STREAM_KEY = "activity:decisions"
 
 
-@router.get("/api/activity")
+def prev_stream_id(entry_id: str) -> str | None:
+    """Return the stream ID immediately before ``entry_id``.
+
+    ``XREVRANGE`` bounds are inclusive, so the next page starts just below the
+    last ID returned. ``None`` means nothing can precede ``entry_id``.
+    """
+    ms, _, seq = entry_id.partition("-")
+    ms_i, seq_i = int(ms), int(seq or 0)
+    if seq_i > 0:
+        return f"{ms_i}-{seq_i - 1}"
+    if ms_i > 0:
+        return f"{ms_i - 1}-{2**64 - 1}"
+    return None
+
+
+@router.get("/api/activity", response_model=None)
 async def get_activity(
     limit: int = Query(20, ge=1, le=100),
     cursor: str | None = None,
+    offset: int | None = Query(None, include_in_schema=False),
+    page: int | None = Query(None, include_in_schema=False),
     redis=Depends(get_redis),
 ) -> dict | JSONResponse:
+    # paging is keyset-only: an offset would force Redis to walk every skipped entry
+    if offset is not None or page is not None:
+        return JSONResponse({"error": "use_cursor"}, status_code=422)
     try:
         start = cursor or "+"
         entries = redis.xrevrange(STREAM_KEY, max=start, min="-", count=limit)
@@ -34,7 +54,9 @@ async def get_activity(
             }
             item["id"] = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
             items.append(item)
-        next_cursor = entries[-1][0] if entries else None
+        next_cursor = None
+        if len(items) == limit:
+            next_cursor = prev_stream_id(items[-1]["id"])
         return {"items": items, "next": next_cursor}
     except Exception:
         logger.exception("Failed to fetch activity")
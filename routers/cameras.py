@@ -11,8 +11,10 @@ import shlex
 import subprocess
 import time
 import uuid
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 from urllib.parse import urlparse, urlsplit
 
 try:  # pragma: no cover - OpenCV is optional
@@ -23,7 +25,13 @@ import threading
 
 import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.templating import Jinja2Templates
 from loguru import logger
 from pydantic import BaseModel, Field, ValidationError, field_validator
@@ -85,12 +93,18 @@ def require_viewer(request: Request):
     return require_roles(request, ["viewer", "admin"])
 
 
-router = APIRouter(dependencies=[Depends(require_admin)])
+# camera payloads (lines, vehicle classes, listings) are serialised with orjson
+router = APIRouter(dependencies=[Depends(require_admin)], default_response_class=ORJSONResponse)
 preview_router = APIRouter(dependencies=[Depends(require_viewer)])
 
 
 # Global lock protecting access to the shared ``cams`` list
 cams_lock = asyncio.Lock()
+# Per-camera locks serialising edits to a single entry. Slow work such as
+# resolution probes runs before any lock is taken, and edits that await take
+# ``cams_lock`` too, so a concurrent delete or import cannot orphan the entry.
+# Entries are never dropped, so a reused id always maps to the same lock.
+_cam_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
 
 # cache preferred transport for camera test probes
 TEST_CAMERA_TRANSPORT: dict[str, str] = {}
@@ -233,31 +247,46 @@ def collect_health(cam, tracker) -> dict:
         logger.exception(f"[{cam_id}] debug stats failed")
         return {}
 
-    latency = float(stats.get("latency") or 0)
+    get = stats.get
+    latency = float(get("latency") or 0)
     if not latency:
-        start = stats.get("last_capture_ts")
-        end = stats.get("last_process_ts")
+        start = get("last_capture_ts")
+        end = get("last_process_ts")
         if start and end:
             latency = float(end) - float(start)
-    frame_ts = float(stats.get("frame_ts") or stats.get("last_process_ts") or 0)
-    packet_loss = int(stats.get("packet_loss") or 0)
+    frame_ts = float(get("frame_ts") or get("last_process_ts") or 0)
+    packet_loss = int(get("packet_loss") or 0)
     return {"latency": latency, "frame_ts": frame_ts, "packet_loss": packet_loss}
 
 
 async def _health_loop() -> None:
     """Background task recording tracker health metrics to Redis."""
+    interval = 1
     while True:
+        trackers = trackers_map
+        if not trackers:
+            await asyncio.sleep(interval)
+            continue
+        updates = {}
         for cam in list(cams):
+            # cameras without a running tracker have nothing to report
             cam_id = cam.get("id")
-            tracker = trackers_map.get(cam_id) if trackers_map else None
-            stats = collect_health(cam, tracker)
-            if not stats:
+            tracker = trackers.get(cam_id)
+            if tracker is None:
                 continue
+            stats = collect_health(cam, tracker)
+            if stats:
+                updates[cam_id] = stats
+        if updates:
+            # one round-trip per tick instead of one per camera
             try:
-                redis.hset(f"camera:{cam_id}:health", mapping=stats)
+                pipe = redis.pipeline(transaction=False)
+                for cam_id, stats in updates.items():
+                    pipe.hset(f"camera:{cam_id}:health", mapping=stats)
+                pipe.execute()
             except Exception:
-                logger.exception(f"[{cam_id}] failed writing health stats")
-        await asyncio.sleep(1)
+                logger.exception(f"failed writing health stats for cameras {list(updates)}")
+        await asyncio.sleep(interval)
 
 
 # init_context routine
@@ -269,7 +298,8 @@ def init_context(
     templates_path,
     redis_facade=None,
 ):
-    global cfg, cams, trackers_map, redis, templates, cams_lock, camera_manager, redisfx
+    global cfg, cams, trackers_map, redis, templates, cams_lock, _cam_locks
+    global camera_manager, redisfx
     from config import config as global_config
 
     cfg = global_config
@@ -280,8 +310,9 @@ def init_context(
     redisfx = redis_facade
     templates = Jinja2Templates(directory=templates_path)
     templates.env.add_extension("jinja2.ext.do")
-    # Recreate the lock for each new application context
+    # Recreate the locks for each new application context
     cams_lock = asyncio.Lock()
+    _cam_locks = defaultdict(asyncio.Lock)
     camera_manager = CameraManager(
         cfg,
         trackers_map,
@@ -655,6 +686,62 @@ async def add_camera(request: Request, manager: CameraManager = Depends(get_came
             return JSONResponse({"error": msg, "hint": hint}, status_code=502)
         return JSONResponse({"error": msg, "hint": hint}, status_code=500)
 
+    cam_uuid = str(uuid.uuid4())
+    site_id = data.get("site_id") or cfg.get("site_id", 1)
+    lat = data.get("latitude")
+    lng = data.get("longitude")
+    try:
+        latitude = float(lat) if lat is not None else None
+    except (TypeError, ValueError):
+        latitude = None
+    try:
+        longitude = float(lng) if lng is not None else None
+    except (TypeError, ValueError):
+        longitude = None
+    now = datetime.utcnow().isoformat()
+    # id and name depend on the current camera list and are filled in under the lock
+    cam = {
+        "id": None,
+        "uuid": cam_uuid,
+        "name": None,
+        "url": url,
+        "type": src_type,
+        "tasks": tasks,
+        "ppe": ppe,
+        "visitor_mgmt": visitor,
+        "enabled": enabled,
+        "show": show,
+        "reverse": reverse,
+        "line_orientation": line_orientation,
+        "line": line,
+        "orientation": orientation,
+        "rtsp_transport": transport,
+        "resolution": resolution,
+        "site_id": site_id,
+        "created_at": now,
+        "updated_at": now,
+        "archived": False,
+    }
+    if latitude is not None:
+        cam["latitude"] = latitude
+    if longitude is not None:
+        cam["longitude"] = longitude
+    if ready_timeout is not None:
+        try:
+            cam["ready_timeout"] = float(ready_timeout)
+        except (TypeError, ValueError):
+            pass
+    if ready_frames is not None:
+        try:
+            cam["ready_frames"] = int(ready_frames)
+        except (TypeError, ValueError):
+            pass
+    if ready_duration is not None:
+        try:
+            cam["ready_duration"] = float(ready_duration)
+        except (TypeError, ValueError):
+            pass
+
     async with cams_lock:
         if lic:
             max_cams = lic.get("max_cameras")
@@ -670,85 +757,35 @@ async def add_camera(request: Request, manager: CameraManager = Depends(get_came
             cam_id = int(new_id)
         else:
             cam_id = max_id + 1
-        cam_uuid = str(uuid.uuid4())
-        site_id = data.get("site_id") or cfg.get("site_id", 1)
-        lat = data.get("latitude")
-        lng = data.get("longitude")
-        try:
-            latitude = float(lat) if lat is not None else None
-        except (TypeError, ValueError):
-            latitude = None
-        try:
-            longitude = float(lng) if lng is not None else None
-        except (TypeError, ValueError):
-            longitude = None
-        now = datetime.utcnow().isoformat()
-        cam = {
-            "id": cam_id,
-            "uuid": cam_uuid,
-            "name": name,
-            "url": url,
-            "type": src_type,
-            "tasks": tasks,
-            "ppe": ppe,
-            "visitor_mgmt": visitor,
-            "enabled": enabled,
-            "show": show,
-            "reverse": reverse,
-            "line_orientation": line_orientation,
-            "line": line,
-            "orientation": orientation,
-            "rtsp_transport": transport,
-            "resolution": resolution,
-            "site_id": site_id,
-            "created_at": now,
-            "updated_at": now,
-            "archived": False,
-        }
-        if latitude is not None:
-            cam["latitude"] = latitude
-        if longitude is not None:
-            cam["longitude"] = longitude
-        if ready_timeout is not None:
-            try:
-                cam["ready_timeout"] = float(ready_timeout)
-            except (TypeError, ValueError):
-                pass
-        if ready_frames is not None:
-            try:
-                cam["ready_frames"] = int(ready_frames)
-            except (TypeError, ValueError):
-                pass
-        if ready_duration is not None:
-            try:
-                cam["ready_duration"] = float(ready_duration)
-            except (TypeError, ValueError):
-                pass
+        cam["id"] = cam_id
+        cam["name"] = name
         cams.append(cam)
         save_cameras(cams, redis)
-        create_camera(
-            Camera(
-                id=cam_uuid,
-                name=name,
-                type=src_type,
-                url=url,
-                analytics={},
-                line=None,
-                orientation=Orientation(orientation),
-                transport=Transport(transport),
-                resolution=resolution,
-                reverse=reverse,
-                show=show,
-                site_id=site_id,
-                enabled=enabled,
-                archived=False,
-                created_at=datetime.fromisoformat(now),
-                updated_at=datetime.fromisoformat(now),
-                latitude=latitude,
-                longitude=longitude,
-            ),
-        )
-        _init_preview_stream(cam)
+    # only the shared list needs the lock; the per-camera record and preview
+    # stream are private to this request
+    create_camera(
+        Camera(
+            id=cam_uuid,
+            name=name,
+            type=src_type,
+            url=url,
+            analytics={},
+            line=None,
+            orientation=Orientation(orientation),
+            transport=Transport(transport),
+            resolution=resolution,
+            reverse=reverse,
+            show=show,
+            site_id=site_id,
+            enabled=enabled,
+            archived=False,
+            created_at=datetime.fromisoformat(now),
+            updated_at=datetime.fromisoformat(now),
+            latitude=latitude,
+            longitude=longitude,
+        ),
+    )
+    _init_preview_stream(cam)
     if enabled and cfg.get("enable_person_tracking", True):
         try:
             await manager.start(cam_uuid)
@@ -767,18 +804,21 @@ async def delete_camera(cam_id: int, request: Request):
         cams[:] = [c for c in cams if c["id"] != cam_id]
         save_cameras(cams, redis)
 
-    await asyncio.to_thread(delete_camera_model, str(cam_id), redis)
-
     if redis:
-        keys = list(redis.scan_iter(f"camera:{cam_id}*"))
-        if keys:
-            redis.delete(*keys)
-        redis.delete(
+        # a single UNLINK covers the model record, its sub-keys and the side
+        # keys, and frees them off the server's main thread; the ":" in the
+        # pattern keeps camera 1 from matching camera 10's keys
+        keys = [
+            f"camera:{cam_id}",
+            f"camera:{cam_id}:health",
             f"camera_pipeline:{cam_id}",
             f"camera_ffmpeg_flags:{cam_id}",
             f"camera_profile:{cam_id}",
-            f"camera:{cam_id}:health",
-        )
+        ]
+        keys.extend(redis.scan_iter(f"camera:{cam_id}:*"))
+        redis.unlink(*keys)
+    else:
+        await asyncio.to_thread(delete_camera_model, str(cam_id), redis)
 
     conn = rtsp_connectors.pop(cam_id, None)
     if conn:
@@ -794,7 +834,7 @@ async def delete_camera(cam_id: int, request: Request):
 
 @router.patch("/cameras/{cam_id}/show")
 async def toggle_show(cam_id: int, request: Request):
-    async with cams_lock:
+    async with _cam_locks[cam_id]:
         for cam in cams:
             if cam["id"] == cam_id:
                 cam["show"] = not cam.get("show", False)
@@ -805,7 +845,7 @@ async def toggle_show(cam_id: int, request: Request):
 
 @router.patch("/cameras/{cam_id}/enabled")
 async def toggle_enabled(cam_id: int, request: Request):
-    async with cams_lock:
+    async with _cam_locks[cam_id]:
         for cam in cams:
             if cam["id"] == cam_id:
                 cam["enabled"] = not cam.get("enabled", True)
@@ -828,7 +868,7 @@ async def toggle_enabled(cam_id: int, request: Request):
 @router.post("/api/cameras/{cam_id}/activate")
 async def activate_camera(cam_id: int, request: Request):
     """Enable a camera and start tracking if permitted."""
-    async with cams_lock:
+    async with _cam_locks[cam_id]:
         for cam in cams:
             if cam["id"] == cam_id:
                 cam["enabled"] = True
@@ -849,7 +889,7 @@ async def activate_camera(cam_id: int, request: Request):
 @router.post("/cameras/{cam_id}/ppe")
 @require_feature("ppe_detection")
 async def toggle_ppe(cam_id: int, request: Request):
-    async with cams_lock:
+    async with _cam_locks[cam_id]:
         for cam in cams:
             if cam["id"] == cam_id:
                 cam["ppe"] = not cam.get("ppe", False)
@@ -868,12 +908,19 @@ async def update_camera(
     lic = cfg.get("license_info", {})
     restart_needed = False
     needs_tracker = False
-    async with cams_lock:
+    if "url" in data and not data["url"].lower().startswith("rtsp://"):
+        return JSONResponse({"error": "unsupported_url_scheme"}, status_code=400)
+    resolution = None
+    if "resolution" in data:
+        async with cams_lock:
+            cur = next((c for c in cams if c["id"] == cam_id), None)
+        if cur is None:
+            return {"error": "Not found"}
+        # probe before locking; the edit below re-looks the camera up
+        resolution = await _resolve_resolution(data.get("url", cur["url"]), data["resolution"])
+    async with _cam_locks[cam_id], cams_lock:
         for cam in cams:
             if cam["id"] == cam_id:
-                url_check = data.get("url", cam.get("url", ""))
-                if "url" in data and not data["url"].lower().startswith("rtsp://"):
-                    return JSONResponse({"error": "unsupported_url_scheme"}, status_code=400)
                 ppe = data.get("ppe") if "ppe" in data else cam.get("ppe", False)
                 visitor = (
                     data.get("visitor_mgmt")
@@ -956,9 +1003,7 @@ async def update_camera(
                     cam["rtsp_transport"] = data["transport"]
                     restart_needed = True
                 if "resolution" in data:
-                    cam["resolution"] = await _resolve_resolution(
-                        data.get("url", cam["url"]), data["resolution"]
-                    )
+                    cam["resolution"] = resolution
                     restart_needed = True
                 if "ready_timeout" in data:
                     try:
@@ -1030,12 +1075,16 @@ async def update_camera_restart(
 ):
     """Persist camera changes and restart its tracker."""
     data = await request.json()
-    async with cams_lock:
+    if data.get("resolution") == "auto":
+        async with cams_lock:
+            cur = next((c for c in cams if c["id"] == cam_id), None)
+        if cur is None:
+            return JSONResponse({"error": "Not found"}, status_code=404)
+        data["resolution"] = await _resolve_resolution(data.get("url", cur["url"]), "auto")
+    async with _cam_locks[cam_id], cams_lock:
         cam = next((c for c in cams if c["id"] == cam_id), None)
         if not cam:
             return JSONResponse({"error": "Not found"}, status_code=404)
-        if data.get("resolution") == "auto":
-            data["resolution"] = await _resolve_resolution(data.get("url", cam["url"]), "auto")
         cam.update(data)
         save_cameras(cams, redis)
     await manager.restart(cam_id)
@@ -1440,6 +1489,31 @@ async def camera_probe(request: Request):
     return summary
 
 
+# license flags derived from the features dict they were built from
+_license_cache: tuple[dict | None, Mapping[str, bool]] = (None, MappingProxyType({}))
+
+
+def _license_flags() -> Mapping[str, bool]:
+    """Return the camera feature flags granted by the current license.
+
+    License updates replace ``cfg["license_info"]``, so the flags are rebuilt
+    only when the features dict is a different object from the cached one.
+    """
+    global _license_cache
+    feats = cfg.get("license_info", {}).get("features", {})
+    src, flags = _license_cache
+    if src is not feats:
+        flags = MappingProxyType(
+            {
+                "ppe_detection": bool(feats.get("ppe_detection", True)),
+                "visitor_mgmt": bool(feats.get("visitor_mgmt", True)),
+                "in_out_counting": bool(feats.get("in_out_counting", True)),
+            }
+        )
+        _license_cache = (feats, flags)
+    return flags
+
+
 @router.post("/cameras/capabilities")
 async def camera_capabilities(request: Request):
     """Return stream resolution, FPS and license flags.
@@ -1467,17 +1541,10 @@ async def camera_capabilities(request: Request):
     if not ok:
         return JSONResponse({"error": "unable to read"}, status_code=400)
 
-    lic_feats = cfg.get("license_info", {}).get("features", {})
-    license_info = {
-        "ppe_detection": bool(lic_feats.get("ppe_detection", True)),
-        "visitor_mgmt": bool(lic_feats.get("visitor_mgmt", True)),
-        "in_out_counting": bool(lic_feats.get("in_out_counting", True)),
-    }
-
     return {
         "resolution": {"width": w, "height": h},
         "fps": fps,
-        "license": license_info,
+        "license": dict(_license_flags()),
     }
 
 
@@ -1561,14 +1628,16 @@ async def get_camera_config(cam_id: int, request: Request):
         cam = next((c for c in cams if c["id"] == cam_id), None)
     if not cam:
         return JSONResponse({"error": "not_found"}, status_code=404)
-    val = redis.get(f"camera_pipeline:{cam_id}")
-    pipeline = val.decode() if val else ""
-    val = redis.get(f"camera_backend:{cam_id}")
-    backend = val.decode() if val else cfg.get("stream_mode", "ffmpeg")
-    val = redis.get(f"camera_ffmpeg_flags:{cam_id}")
-    ffmpeg_flags = val.decode() if val else ""
-    val = redis.get(f"camera_profile:{cam_id}")
-    profile = val.decode() if val else ""
+    pipeline, backend, ffmpeg_flags, profile = redis.mget(
+        f"camera_pipeline:{cam_id}",
+        f"camera_backend:{cam_id}",
+        f"camera_ffmpeg_flags:{cam_id}",
+        f"camera_profile:{cam_id}",
+    )
+    pipeline = pipeline or ""
+    backend = backend or cfg.get("stream_mode", "ffmpeg")
+    ffmpeg_flags = ffmpeg_flags or ""
+    profile = profile or ""
     return {
         "url": cam.get("url", ""),
         "backend": backend,
@@ -1609,7 +1678,7 @@ async def update_camera_config(cam_id: int, request: Request):
         redis.set(f"camera_ffmpeg_flags:{cam_id}", ffmpeg_flags)
     else:
         redis.delete(f"camera_ffmpeg_flags:{cam_id}")
-    async with cams_lock:
+    async with _cam_locks[cam_id]:
         cam = next((c for c in cams if c["id"] == cam_id), None)
         if not cam:
             return JSONResponse({"error": "not_found"}, status_code=404)
@@ -1645,7 +1714,7 @@ async def patch_camera(cam_id: int, request: Request):
     cam = None
     if "counting" in data:
         counting = bool(data.get("counting"))
-        async with cams_lock:
+        async with _cam_locks[cam_id]:
             cam = next((c for c in cams if c["id"] == cam_id), None)
             if cam is not None:
                 tasks = set(cam.get("tasks", []))
@@ -1715,17 +1784,13 @@ async def get_camera_effective_config(cam_id: int):
     """Return counter configuration stored in Redis for ``cam_id``."""
     raw = redis.hgetall(f"cam:{cam_id}:line")
     line_data: dict[str, float | str] = {}
-    for k, v in raw.items():
-        key = k.decode() if isinstance(k, bytes) else k
-        if key == "orientation":
-            line_data[key] = v.decode() if isinstance(v, bytes) else v
-        else:
-            line_data[key] = float(v)
+    for key, v in raw.items():
+        line_data[key] = v if key == "orientation" else float(v)
     async with cams_lock:
         cam = next((c for c in cams if c["id"] == cam_id), None)
     count_tasks = {"in_count", "out_count", "inout_count"}
     counting = bool(cam and any(t in cam.get("tasks", []) for t in count_tasks))
-    classes = [c.decode() for c in redis.smembers(f"cam:{cam_id}:vehicle_classes")]
+    classes = list(redis.smembers(f"cam:{cam_id}:vehicle_classes"))
     return {
         "line": line_data,
         "counting": counting,
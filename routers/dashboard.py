@@ -198,9 +198,10 @@ async def index(
             cam["token"] = sign_token(str(cam.get("id")), secret)
         except Exception:
             cam["token"] = ""
-    count_keys = [f"{item}_count" for item in ANOMALY_ITEMS]
+    from core.stats import ANOMALY_COUNT_KEYS
+
     try:
-        count_vals = await run_with_timeout(redis.mget, count_keys, timeout=5)
+        count_vals = await run_with_timeout(redis.mget, ANOMALY_COUNT_KEYS, timeout=5)
     except asyncio.TimeoutError:
         logger.error("Timed out fetching anomaly counts from Redis")
         return RedirectResponse("/dashboard?error=Unable%20to%20load%20stats", status_code=303)
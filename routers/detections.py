@@ -28,6 +28,8 @@ def get_stop_event() -> Any:
 
 logger = logging.getLogger(__name__)
 
+_RESOLUTION_RE = re.compile(r"^\s*(\d+)\s*[xX]\s*(\d+)\s*$")
+
 router = APIRouter()
 
 
@@ -82,7 +84,7 @@ async def _build_payload(
             src_h, src_w = tracker.last_frame_shape
         elif cam_cfg.get("resolution"):
             res = cam_cfg.get("resolution")
-            match = re.match(r"^\s*(\d+)\s*[xX]\s*(\d+)\s*$", str(res))
+            match = _RESOLUTION_RE.match(str(res))
             if not match:
                 raise ValueError(f"Invalid resolution format: {res}")
             src_w, src_h = map(int, match.groups())
@@ -19,6 +19,7 @@ router = APIRouter()
 BASE_DIR = Path(__file__).resolve().parent.parent
 UPLOAD_DIR = BASE_DIR / "static" / "feedback"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+MAX_ATTACHMENT_BYTES = 5 * 1024 * 1024
 
 
 @router.get("/feedback", response_class=HTMLResponse)
@@ -91,7 +92,7 @@ async def submit_feedback(
                     content={"ok": False, "message": "invalid image type", "data": None},
                 )
             content = await file.read()
-            if len(content) > 5 * 1024 * 1024:
+            if len(content) > MAX_ATTACHMENT_BYTES:
                 return JSONResponse(
                     status_code=400,
                     content={"ok": False, "message": "file too large", "data": None},
@@ -3,11 +3,31 @@ from __future__ import annotations
 """Pydantic models for camera configuration."""
 
 import re
+import sys
 from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, ValidationInfo, model_validator
 
+_RESOLUTION_RE = re.compile(r"\d+x\d+")
+
+
+def _router_state() -> tuple[list, dict]:
+    """Return the camera router's live ``cams`` and ``cfg``.
+
+    The module is looked up in ``sys.modules`` first so validation does not
+    go through the import machinery on every call; its attributes are read
+    each time because ``init_context`` rebinds them.
+    """
+    rc = sys.modules.get("routers.cameras")
+    if rc is None:
+        try:
+            import routers.cameras as rc
+        except ImportError:
+            # During validation in isolation, routers.cameras may not be available
+            return [], {}
+    return getattr(rc, "cams", []), getattr(rc, "cfg", {})
+
 
 class Orientation(str, Enum):
     """Image orientation options."""
@@ -78,7 +98,7 @@ class CameraBase(BaseModel):
             if (
                 isinstance(data.resolution, str)
                 and data.resolution not in Resolution._value2member_map_
-                and not re.fullmatch(r"\d+x\d+", data.resolution)
+                and not _RESOLUTION_RE.fullmatch(data.resolution)
             ):
                 raise ValueError("invalid resolution")
         if data.name:
@@ -88,13 +108,7 @@ class CameraBase(BaseModel):
                 cams = info.context.get("cams") or []
                 cfg = info.context.get("cfg") or {}
             else:
-                try:
-                    from routers.cameras import cams as rcams
-                    from routers.cameras import cfg as rcfg
-                except ImportError:
-                    # During validation in isolation, routers.cameras may not be available
-                    rcams, rcfg = [], {}
-                cams, cfg = rcams, rcfg
+                cams, cfg = _router_state()
             site_id = data.site_id if data.site_id is not None else cfg.get("site_id", 1)
             for c in cams:
                 if c.get("archived"):
@@ -170,7 +170,7 @@ def init_app(
     set_log_level(cfg.get("log_level", LOG_LEVEL))
 
     branding_path = str(Path(config_path_local).with_name("branding.json"))
-    cfg["branding"] = load_branding(branding_path)
+    cfg["branding"] = dict(load_branding(branding_path))
     persisted = load_license() or {}
     key = persisted.get("key") or cfg.get("license_key", "")
     license_info = verify_license(key)
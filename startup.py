@@ -1,4 +1,6 @@
 import asyncio
+import os
+import statistics
 import time
 from pathlib import Path
 from typing import Any, Awaitable, Callable
@@ -6,6 +8,7 @@ from typing import Any, Awaitable, Callable
 from fastapi import FastAPI
 from loguru import logger
 from redis import Redis
+from redis.exceptions import RedisError
 
 from config import PPE_TASKS
 from config.versioning import watch_config
@@ -18,26 +21,34 @@ from modules.utils import SNAP_DIR
 from utils.gpu import get_device
 
 BASE_DIR = Path(__file__).parent
+# Median ``start_tracker`` duration from the previous startup, in milliseconds.
+TRACKER_INIT_KEY = "stats:tracker_init_ms"
 
 
 async def start_worker(name: str, coro: Callable[[], Awaitable[None]]) -> None:
-    """Run a worker coroutine with standard logging and error handling."""
+    """Run a worker setup coroutine with standard logging and error handling.
+
+    Worker setup only constructs and starts the worker's own thread, so the
+    coroutine is awaited directly instead of being wrapped in a task.
+    """
     logger.info("Starting {}", name)
-    task = asyncio.create_task(coro())
-    logger.info("{} started", name)
     try:
-        await task
-    except (RuntimeError, OSError) as e:
+        await coro()
+    except Exception as e:
         logger.exception("{} initialization failed: {}", name, e)
         raise
-    finally:
-        logger.info("{} stopped", name)
+    logger.info("{} started", name)
 
 
-async def preload_models(cfg: dict[str, Any], cams: list[dict[str, Any]]) -> None:
+async def preload_models(
+    cfg: dict[str, Any],
+    cams: list[dict[str, Any]],
+    features: dict[str, Any] | None = None,
+) -> None:
     """Preload heavy models into the shared registry."""
     device = get_device(device=cfg.get("device"))
-    features = cfg.get("features", {})
+    if features is None:
+        features = cfg.get("features") or {}
     in_out_enabled = features.get("in_out_counting", True)
     ppe_enabled = features.get("ppe_detection", True)
 
@@ -55,7 +66,10 @@ async def preload_models(cfg: dict[str, Any], cams: list[dict[str, Any]]) -> Non
         "full_monitor",
         "visitor_mgmt",
     } | set(PPE_TASKS)
-    needs_person = any(t in required_tasks for cam in cams for t in cam.get("tasks", []))
+    cam_tasks = {t for cam in cams for t in cam.get("tasks", [])}
+    needs_person = not cam_tasks.isdisjoint(required_tasks)
+    needs_plate = any("plate" in t for t in cam_tasks)
+    needs_ppe = not cam_tasks.isdisjoint(PPE_TASKS)
     if not needs_person:
         cfg["enable_person_tracking"] = False
         return
@@ -73,8 +87,9 @@ async def preload_models(cfg: dict[str, Any], cams: list[dict[str, Any]]) -> Non
     person_model = cfg.get("person_model")
     if person_model and cfg.get("enable_person_tracking", True):
         tasks.append(_load(lambda: get_yolo(person_model, device), f"{person_model}"))
-    plate_model = cfg.get("plate_model", "license_plate_detector.pt")
-    tasks.append(_load(lambda: get_yolo(plate_model, device), f"{plate_model}"))
+    if needs_plate:
+        plate_model = cfg.get("plate_model", "license_plate_detector.pt")
+        tasks.append(_load(lambda: get_yolo(plate_model, device), f"{plate_model}"))
     if tasks:
         await asyncio.gather(*tasks)
 
@@ -85,9 +100,50 @@ async def preload_models(cfg: dict[str, Any], cams: list[dict[str, Any]]) -> Non
     basic_detector = BasicDetector(basic_weights, device=device)
     register_detector("basic", basic_detector)
 
-    ppe_weights = cfg.get("ppe_model", "mymodel.pt")
-    ppe_detector = PPEDetector(ppe_weights, device=device)
-    register_detector("ppe", ppe_detector)
+    if needs_ppe:
+        ppe_weights = cfg.get("ppe_model", "mymodel.pt")
+        ppe_detector = PPEDetector(ppe_weights, device=device)
+        register_detector("ppe", ppe_detector)
+
+
+def _tracker_init_workers(median_ms: float | None, n_cams: int, cfg: dict[str, Any]) -> int:
+    """Return how many trackers to start concurrently.
+
+    Without a recorded median every camera starts at once. Otherwise the
+    width is how many starts the CPUs can absorb within
+    ``tracker_init_target_s``: fast starts stay fully parallel and only slow
+    ones are throttled.
+    """
+    if not median_ms or n_cams <= 0:
+        return max(1, n_cams)
+    target_ms = float(cfg.get("tracker_init_target_s", 10)) * 1000
+    return max(1, min(n_cams, int((os.cpu_count() or 1) * target_ms / median_ms)))
+
+
+def _read_init_median(redis_client: Redis | None) -> float | None:
+    """Return the median tracker start time recorded by the last startup."""
+    if redis_client is None:
+        return None
+    try:
+        raw = redis_client.get(TRACKER_INIT_KEY)
+        return float(raw) if raw else None
+    except (RedisError, TypeError, ValueError):
+        return None
+
+
+def _record_init_durations(redis_client: Redis | None, durations: list[float]) -> None:
+    """Log tracker start timings and persist their median for the next startup."""
+    if not durations:
+        return
+    median_ms = statistics.median(durations) * 1000
+    p95_ms = statistics.quantiles(durations, n=20)[-1] * 1000 if len(durations) > 1 else median_ms
+    logger.info("tracker-init median={:.0f}ms p95={:.0f}ms", median_ms, p95_ms)
+    if redis_client is None:
+        return
+    try:
+        redis_client.set(TRACKER_INIT_KEY, int(median_ms))
+    except RedisError:
+        logger.warning("Failed to persist tracker init stats")
 
 
 async def init_trackers(
@@ -104,11 +160,20 @@ async def init_trackers(
         return tasks
 
     enabled = [cam for cam in cams if cam.get("enabled", True)]
-    logger.info("Initializing trackers for {} cameras", len(enabled))
+    median_ms = await asyncio.to_thread(_read_init_median, redis_client)
+    workers = _tracker_init_workers(median_ms, len(enabled), cfg)
+    logger.info("Initializing trackers for {} cameras ({} at a time)", len(enabled), workers)
+    sem = asyncio.Semaphore(workers)
+    durations: list[float] = []
     try:
 
         async def _start(cam: dict[str, Any]) -> None:
-            tr = await asyncio.to_thread(start_tracker, cam, cfg, trackers, redis_client)
+            async with sem:
+                t0 = time.perf_counter()
+                tr = await asyncio.to_thread(start_tracker, cam, cfg, trackers, redis_client)
+                took = time.perf_counter() - t0
+            durations.append(took)
+            logger.info("tracker-init cam={} took={:.2f}s", cam.get("id"), took)
             if tr:
                 tasks.append(
                     asyncio.create_task(
@@ -117,6 +182,7 @@ async def init_trackers(
                 )
 
         await asyncio.gather(*(_start(cam) for cam in enabled))
+        await asyncio.to_thread(_record_init_durations, redis_client, durations)
         await asyncio.to_thread(start_watchdog, trackers)
         logger.info("Trackers initialized")
     except (RuntimeError, OSError) as e:
@@ -135,9 +201,12 @@ async def ppe_worker(
     cfg: dict[str, Any],
     trackers: dict[int, PersonTracker],
     redis_client: Redis,
+    features: dict[str, Any] | None = None,
 ) -> None:
     """Launch the PPE detection worker if enabled and supported."""
-    if cfg.get("features", {}).get("ppe_detection"):
+    if features is None:
+        features = cfg.get("features") or {}
+    if features.get("ppe_detection"):
         device = get_device()
         if getattr(device, "type", "") == "cuda":
             from core.stats import broadcast_stats
@@ -176,14 +245,15 @@ async def start_background_workers(
     trackers: dict[int, PersonTracker],
     redis_client: Redis,
 ) -> list[asyncio.Task[None]]:
-    """Preload models and create background tasks."""
-    await preload_models(cfg, cams)
+    """Preload models, start workers and create background tasks."""
+    features = cfg.get("features") or {}
+    await preload_models(cfg, cams, features)
     watcher_tasks = await init_trackers(cams, cfg, trackers, redis_client, app.state.config_path)
     worker_defs = [
         ("alert-worker", lambda: alert_worker(app, cfg, redis_client)),
-        ("ppe-detector", lambda: ppe_worker(app, cfg, trackers, redis_client)),
+        ("ppe-detector", lambda: ppe_worker(app, cfg, trackers, redis_client, features)),
     ]
-    if cfg.get("features", {}).get("visitor_mgmt"):
+    if features.get("visitor_mgmt"):
         worker_defs.append(("visitor-worker", lambda: visitor_worker(app, cfg, redis_client)))
 
     tasks = watcher_tasks
@@ -193,7 +263,9 @@ async def start_background_workers(
             name="counter-config-listener",
         )
     )
-    tasks.extend(
-        asyncio.create_task(start_worker(name, worker), name=name) for name, worker in worker_defs
+    # Setup failures are logged by ``start_worker`` and must not abort startup.
+    await asyncio.gather(
+        *(start_worker(name, worker) for name, worker in worker_defs),
+        return_exceptions=True,
     )
     return tasks
@@ -2,10 +2,14 @@
 
 # ruff: noqa: E402
 
+import asyncio
 import sys
 from pathlib import Path
+from typing import Iterator
 
 import fakeredis
+import httpx
+import numpy as np
 import pytest
 from fakeredis.aioredis import FakeRedis as AsyncFakeRedis
 from fastapi.testclient import TestClient
@@ -15,45 +19,42 @@ sys.path.insert(0, str(ROOT))
 
 import types
 
+_CV2_STUB = types.SimpleNamespace(
+    cvtColor=lambda img, code: img,
+    COLOR_BGR2RGB=0,
+    imwrite=lambda *a, **k: True,
+    imencode=lambda *a, **k: (True, np.array([0], dtype=np.uint8)),
+)
+_DEEPSORT_TRACKER_STUB = types.SimpleNamespace(DeepSort=object)
+_STUBS = {
+    "ultralytics": types.SimpleNamespace(YOLO=lambda *a, **k: None),
+    "deep_sort_realtime": types.SimpleNamespace(deepsort_tracker=_DEEPSORT_TRACKER_STUB),
+    "deep_sort_realtime.deepsort_tracker": _DEEPSORT_TRACKER_STUB,
+    "cv2": _CV2_STUB,
+}
 try:
     import torch  # noqa: F401
 except Exception:  # pragma: no cover - exercised when torch is missing
-    sys.modules.setdefault(
-        "torch",
-        types.SimpleNamespace(
-            cuda=types.SimpleNamespace(is_available=lambda: False),
-            set_num_threads=lambda n: None,
-        ),
+    _STUBS["torch"] = types.SimpleNamespace(
+        cuda=types.SimpleNamespace(is_available=lambda: False),
+        set_num_threads=lambda n: None,
     )
-sys.modules.setdefault("ultralytics", types.SimpleNamespace(YOLO=lambda *a, **k: None))
-sys.modules.setdefault(
-    "deep_sort_realtime",
-    types.SimpleNamespace(deepsort_tracker=types.SimpleNamespace(DeepSort=object)),
-)
-sys.modules.setdefault(
-    "deep_sort_realtime.deepsort_tracker", types.SimpleNamespace(DeepSort=object)
-)
-sys.modules.setdefault(
-    "cv2",
-    types.SimpleNamespace(
-        cvtColor=lambda img, code: img,
-        COLOR_BGR2RGB=0,
-        imwrite=lambda *a, **k: True,
-    ),
-)
+sys.modules.update({name: mod for name, mod in _STUBS.items() if name not in sys.modules})
+
 
+# run the suite on the same loop uvicorn picks in production when uvloop is present
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - uvloop is optional
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 import server.startup as startup
 from utils.redis_facade import RedisFacade
 
-sys.modules["cv2"] = sys.modules.get(
-    "cv2",
-    types.SimpleNamespace(
-        cvtColor=lambda img, code: img,
-        COLOR_BGR2RGB=0,
-        imwrite=lambda *a, **k: True,
-    ),
-)
+sys.modules.setdefault("cv2", _CV2_STUB)
 
 import threading
 
@@ -133,15 +134,7 @@ def client() -> TestClient:
         "get_sync_client",
         lambda url=None: fakeredis.FakeRedis(decode_responses=True),
     )
-    mp.setattr(
-        app,
-        "get_sync_client",
-        lambda url=None: fakeredis.FakeRedis(decode_responses=True),
-    )
     mp.setattr(app, "probe_gstreamer", lambda cfg: None, raising=False)
-
-    import asyncio
-
     mp.setattr(asyncio, "create_task", lambda *a, **k: None)
 
     async def _fake_get_client(url: str | None = None):
@@ -168,17 +161,86 @@ def client() -> TestClient:
     mp.undo()
 
 
+@pytest.fixture(scope="session")
+def asgi_client(client: TestClient) -> Iterator[httpx.AsyncClient]:
+    """In-process async client on the session app, sharing the login cookie.
+
+    Requests are dispatched straight into the ASGI app without the portal
+    thread ``TestClient`` runs every call through; each test drives it from
+    its own event loop.
+    """
+    transport = httpx.ASGITransport(app=client.app)
+    c = httpx.AsyncClient(transport=transport, base_url="http://testserver", cookies=client.cookies)
+    yield c
+    asyncio.run(c.aclose())
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+# One in-memory server and client reused by every test; flushed around each
+# test instead of being rebuilt.
+_SHARED_SERVER = fakeredis.FakeServer()
+_SHARED_REDIS = fakeredis.FakeRedis(server=_SHARED_SERVER)
+# Bare ``FakeRedis()`` clients share one default server, so it is flushed too.
+_DEFAULT_REDIS = fakeredis.FakeRedis()
+
+
+@pytest.fixture(scope="session")
+def fake_redis():
+    """Session-wide decoding client on the shared server, flushed per test."""
+    return fakeredis.FakeRedis(server=_SHARED_SERVER, decode_responses=True)
+
+
 @pytest.fixture(scope="function")
-def redis_client():
-    client = fakeredis.FakeRedis(decode_responses=True)
-    client.flushall()
-    yield client
-    client.flushall()
+def redis_client(fake_redis):
+    return fake_redis
+
+
+@pytest.fixture
+def fake_redis_raw():
+    """Byte-returning client on the shared server, flushed per test."""
+    return _SHARED_REDIS
 
 
 @pytest.fixture(autouse=True)
 def _flush_redis():
-    client = fakeredis.FakeRedis()
-    client.flushall()
+    _SHARED_REDIS.flushall()
+    _DEFAULT_REDIS.flushall()
     yield
-    client.flushall()
+    _SHARED_REDIS.flushall()
+    _DEFAULT_REDIS.flushall()
+
+
+_CAMERA_STATE_DICTS = (
+    "PREVIEW_TOKENS",
+    "TEST_STREAMS",
+    "TEST_CAMERA_PROBES",
+    "TEST_TOKENS",
+    "TEST_CAMERA_TRANSPORT",
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_camera_module_state():
+    """Empty the camera router's per-process registries in place."""
+    cameras = sys.modules.get("routers.cameras")
+    if cameras is not None:
+        for name in _CAMERA_STATE_DICTS:
+            state = getattr(cameras, name, None)
+            if isinstance(state, dict):
+                state.clear()
+    yield
+
+
+@pytest.fixture
+def captured_logs():
+    """Collect loguru messages (DEBUG and up) emitted during the test."""
+    from loguru import logger
+
+    logs: list[str] = []
+    handle = logger.add(logs.append, level="DEBUG", format="{message}")
+    yield logs
+    logger.remove(handle)
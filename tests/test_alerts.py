@@ -4,8 +4,10 @@ import asyncio
 import json
 import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import fakeredis
+import orjson
 import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -15,6 +17,13 @@ sys.path.insert(0, str(ROOT))
 
 from modules import alerts as alerts_module
 from routers import alerts
+from utils.redis import (
+    PPE_STATUS_SETS_READY,
+    backfill_ppe_status_sets,
+    incr_ppe_count,
+    ppe_status_key,
+    record_ppe_log,
+)
 
 
 # DummyRequest class encapsulates dummyrequest behavior
@@ -71,51 +80,180 @@ def test_alert_worker_threshold(tmp_path, monkeypatch):
     r.zadd(
         "ppe_logs",
         {
-            json.dumps({"ts": now - 30, "status": "no_helmet"}): now - 30,
-            json.dumps({"ts": now - 10, "status": "no_helmet"}): now - 10,
+            orjson.dumps({"ts": now - 30, "status": "no_helmet"}): now - 30,
+            orjson.dumps({"ts": now - 10, "status": "no_helmet"}): now - 10,
         },
     )
+    for ts in (now - 30, now - 10):
+        incr_ppe_count(r, "no_helmet", ts)
     worker.check_rules()
     assert calls
     assert int(worker.redis.get("alert_rule_0_last") or 0) > 0
 
 
-def test_save_alerts_validation(client):
-    resp = client.post(
-        "/alerts",
-        json={"rules": [{"metric": "bad", "value": 1, "recipients": "a@example.com"}]},
+def test_alert_worker_reads_per_status_set(tmp_path, monkeypatch):
+    rows_sent = []
+    monkeypatch.setattr(
+        alerts_module.AlertWorker,
+        "_send_report",
+        lambda self, rows, *a, **k: rows_sent.append(rows),
     )
-    assert resp.status_code == 400
-    resp = client.post(
-        "/alerts",
-        json={"rules": [{"metric": "no_helmet", "value": 0, "recipients": "a@example.com"}]},
-    )
-    assert resp.status_code == 400
-    resp = client.post(
-        "/alerts",
-        json={"rules": [{"metric": "no_helmet", "value": 1, "recipients": "bad"}]},
+    r = fakeredis.FakeRedis()
+    now = int(time.time())
+    cfg = {
+        "alert_rules": [
+            {
+                "metric": "no_helmet",
+                "type": "threshold",
+                "value": 2,
+                "window": 1,
+                "recipients": "a@example.com",
+            }
+        ],
+        "email_enabled": True,
+    }
+    worker = alerts_module.AlertWorker(cfg, r, tmp_path, start=False)
+    helmet = [json.dumps({"ts": now - i, "status": "no_helmet"}) for i in (30, 10)]
+    vest = json.dumps({"ts": now - 20, "status": "no_vest_jacket"})
+    # logged before the per-status sets existed
+    r.zadd("ppe_logs", {helmet[0]: now - 30, vest: now - 20})
+    backfill_ppe_status_sets(r)
+    assert r.get(PPE_STATUS_SETS_READY)
+    assert r.zcard(ppe_status_key("no_vest_jacket")) == 1
+    record_ppe_log(r, helmet[1], "no_helmet", now - 10)
+    scanned = []
+    collect = worker._collect_rows
+    monkeypatch.setattr(
+        worker, "_collect_rows", lambda key, *a, **k: scanned.append(key) or collect(key, *a, **k)
     )
-    assert resp.status_code == 400
-    resp = client.post(
-        "/alerts",
-        json={
-            "rules": [
-                {
-                    "metric": "no_helmet",
-                    "type": "threshold",
-                    "value": 1,
-                    "window": 3,
-                    "recipients": "a@example.com",
-                }
-            ]
-        },
+
+    worker.check_rules()
+
+    assert scanned == [ppe_status_key("no_helmet")]
+    assert [[row["status"] for row in rows] for rows in rows_sent] == [["no_helmet"] * 2]
+
+
+def test_alert_worker_scans_ppe_logs_before_backfill(tmp_path, monkeypatch):
+    r = fakeredis.FakeRedis()
+    now = int(time.time())
+    cfg = {
+        "alert_rules": [
+            {"metric": "no_helmet", "type": "event", "value": 1, "recipients": "a@example.com"}
+        ],
+        "email_enabled": True,
+    }
+    worker = alerts_module.AlertWorker(cfg, r, tmp_path, start=False)
+    r.zadd("ppe_logs", {json.dumps({"ts": now - 30, "status": "no_helmet"}): now - 30})
+    # a new write creates the per-status set, but it misses the older entry
+    record_ppe_log(r, json.dumps({"ts": now - 10, "status": "no_helmet"}), "no_helmet", now - 10)
+    rows_sent = []
+    monkeypatch.setattr(
+        alerts_module.AlertWorker,
+        "_send_report",
+        lambda self, rows, *a, **k: rows_sent.append(rows),
     )
-    assert resp.status_code == 400
-    ok = client.post(
-        "/alerts",
-        json={"rules": [{"metric": "no_helmet", "value": 1, "recipients": "a@example.com"}]},
+
+    worker.check_rules()
+
+    assert [row["ts"] for row in rows_sent[0]] == [now - 30]
+
+
+def test_record_ppe_log_trims_status_set_with_ppe_logs():
+    r = fakeredis.FakeRedis()
+    now = int(time.time())
+    record_ppe_log(r, "old", "no_helmet", now - 100, retention_secs=50)
+    for i in range(3):
+        record_ppe_log(r, f"new{i}", "no_helmet", now + i, retention_secs=50, limit=2)
+    for key in ("ppe_logs", ppe_status_key("no_helmet")):
+        assert r.zrange(key, 0, -1) == [b"new1", b"new2"]
+
+
+def test_alert_worker_threshold_skips_scan_below_count(tmp_path, monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        alerts_module.AlertWorker, "_send_report", lambda self, rows, *a, **k: sent.append(rows)
     )
-    assert ok.status_code == 200 and ok.json()["saved"]
+    r = fakeredis.FakeRedis()
+    now = int(time.time())
+    cfg = {
+        "alert_rules": [
+            {
+                "metric": "no_helmet",
+                "type": "threshold",
+                "value": 2,
+                "window": 1,
+                "recipients": "a@example.com",
+            }
+        ],
+        "email_enabled": True,
+    }
+    worker = alerts_module.AlertWorker(cfg, r, tmp_path, start=False)
+    monkeypatch.setattr(alerts_module, "time", SimpleNamespace(time=lambda: now))
+    # counting started before the window, so minutes without a bucket count as zero
+    incr_ppe_count(r, "no_vest_jacket", now - 600)
+    incr_ppe_count(r, "no_helmet", now - 10)
+    scanned = []
+    monkeypatch.setattr(worker, "_collect_rows", lambda *a, **k: scanned.append(a) or [])
+
+    worker.check_rules()
+    assert not scanned and not sent
+
+    incr_ppe_count(r, "no_helmet", now - 5)
+    worker.check_rules()
+    assert scanned
+
+
+def test_alert_worker_threshold_scans_when_counting_starts_in_window(tmp_path, monkeypatch):
+    r = fakeredis.FakeRedis()
+    now = int(time.time())
+    cfg = {
+        "alert_rules": [
+            {
+                "metric": "no_helmet",
+                "type": "threshold",
+                "value": 2,
+                "window": 1,
+                "recipients": "a@example.com",
+            }
+        ],
+        "email_enabled": True,
+    }
+    worker = alerts_module.AlertWorker(cfg, r, tmp_path, start=False)
+    monkeypatch.setattr(alerts_module, "time", SimpleNamespace(time=lambda: now))
+    # the first counted log is inside the window; earlier rows may predate the counters
+    incr_ppe_count(r, "no_helmet", now)
+    scanned = []
+    monkeypatch.setattr(worker, "_collect_rows", lambda *a, **k: scanned.append(a) or [])
+
+    worker.check_rules()
+    assert scanned
+
+
+@pytest.mark.parametrize(
+    "rule,expected",
+    [
+        ({"metric": "bad", "value": 1, "recipients": "a@example.com"}, 400),
+        ({"metric": "no_helmet", "value": 0, "recipients": "a@example.com"}, 400),
+        ({"metric": "no_helmet", "value": 1, "recipients": "bad"}, 400),
+        (
+            {
+                "metric": "no_helmet",
+                "type": "threshold",
+                "value": 1,
+                "window": 3,
+                "recipients": "a@example.com",
+            },
+            400,
+        ),
+        ({"metric": "no_helmet", "value": 1, "recipients": "a@example.com"}, 200),
+    ],
+    ids=["bad-metric", "zero-value", "bad-recipient", "bad-window", "ok"],
+)
+def test_save_alerts_validation(client, rule, expected):
+    resp = client.post("/alerts", json={"rules": [rule]})
+    assert resp.status_code == expected
+    if expected == 200:
+        assert resp.json()["saved"]
 
 
 def test_update_email_validation(client):
@@ -125,8 +263,21 @@ def test_update_email_validation(client):
     assert ok.status_code == 200 and ok.json()["saved"]
 
 
-def test_consume_events_triggers_check_rules(tmp_path, monkeypatch):
-    worker = alerts_module.AlertWorker({}, None, tmp_path, start=False)
+@pytest.fixture(scope="module")
+def _shared_worker(tmp_path_factory):
+    return alerts_module.AlertWorker({}, None, tmp_path_factory.mktemp("alerts"), start=False)
+
+
+@pytest.fixture
+def worker(_shared_worker):
+    """Idle worker reused across tests; per-test patches are undone by monkeypatch."""
+    yield _shared_worker
+    _shared_worker.cfg = {}
+    _shared_worker.redis = None
+    _shared_worker.running = True
+
+
+def test_consume_events_triggers_check_rules(worker, monkeypatch):
     called = []
 
     monkeypatch.setattr(worker, "check_rules", lambda: called.append(True))
@@ -139,8 +290,7 @@ def test_consume_events_triggers_check_rules(tmp_path, monkeypatch):
     assert called
 
 
-def test_run_periodic_tasks_executes(tmp_path, monkeypatch):
-    worker = alerts_module.AlertWorker({}, None, tmp_path, start=False)
+def test_run_periodic_tasks_executes(worker, monkeypatch):
     calls = []
 
     monkeypatch.setattr(worker, "check_rules", lambda: calls.append("rules"))
@@ -154,8 +304,7 @@ def test_run_periodic_tasks_executes(tmp_path, monkeypatch):
     assert new_last == now
 
 
-def test_handle_loop_error_logs_exception(tmp_path, monkeypatch):
-    worker = alerts_module.AlertWorker({}, None, tmp_path, start=False)
+def test_handle_loop_error_logs_exception(worker, monkeypatch):
     captured = {}
 
     def fake_exception(msg, exc):
@@ -1,19 +1,91 @@
+import re
+
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from routers import api_activity
+
+
+@pytest.fixture
+def client(fake_redis) -> TestClient:
+    app = FastAPI()
+    app.include_router(api_activity.router)
+    app.state.redis_client = fake_redis
+    return TestClient(app)
+
 
 def test_activity_pagination(client: TestClient):
     r = client.app.state.redis_client
-    r.xadd("activity:decisions", {"value": "a"}, id="1-0")
-    r.xadd("activity:decisions", {"value": "b"}, id="2-0")
-    r.xadd("activity:decisions", {"value": "c"}, id="3-0")
+    with r.pipeline(transaction=False) as pipe:
+        pipe.xadd(api_activity.STREAM_KEY, {"value": "a"}, id="1-0")
+        pipe.xadd(api_activity.STREAM_KEY, {"value": "b"}, id="2-0")
+        pipe.xadd(api_activity.STREAM_KEY, {"value": "c"}, id="3-0")
+        pipe.execute()
 
     resp = client.get("/api/activity?limit=2")
     assert resp.status_code == 200
     data = resp.json()
     assert [i["value"] for i in data["items"]] == ["c", "b"]
     cursor = data["next"]
+    # the cursor is the exclusive upper bound just below "2-0"
+    assert cursor == api_activity.prev_stream_id("2-0")
 
     resp2 = client.get(f"/api/activity?limit=2&cursor={cursor}")
     assert resp2.status_code == 200
     data2 = resp2.json()
     assert [i["value"] for i in data2["items"]] == ["a"]
+    assert data2["next"] is None
+
+
+def test_activity_rejects_offset(client: TestClient):
+    assert client.get("/api/activity?offset=100").status_code == 422
+    assert client.get("/api/activity?page=2").status_code == 422
+
+
+def test_activity_cursor_is_opaque(client: TestClient):
+    r = client.app.state.redis_client
+    with r.pipeline(transaction=False) as pipe:
+        for i in range(1, 6):
+            pipe.xadd(api_activity.STREAM_KEY, {"value": str(i)}, id=f"{i}-0")
+        pipe.execute()
+
+    data = client.get("/api/activity?limit=2").json()
+    assert re.fullmatch(r"\d+-\d+", data["next"])
+
+    # any stream id is a valid bookmark, seeking straight to it
+    resp = client.get("/api/activity?limit=2&cursor=3-0")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [i["id"] for i in data["items"]] == ["3-0", "2-0"]
+    assert data["next"] == api_activity.prev_stream_id("2-0")
+
+
+def test_prev_stream_id():
+    assert api_activity.prev_stream_id("5-3") == "5-2"
+    assert api_activity.prev_stream_id("5-0") == f"4-{2**64 - 1}"
+    assert api_activity.prev_stream_id("0-0") is None
+
+
+def test_activity_page_reads_only_limit_from_large_stream(client: TestClient, monkeypatch):
+    r = client.app.state.redis_client
+    pipe = r.pipeline(transaction=False)
+    for i in range(10_000):
+        pipe.xadd(api_activity.STREAM_KEY, {"value": str(i)}, maxlen=10_000, approximate=True)
+    pipe.execute()
+
+    calls = []
+    orig = r.xrevrange
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs)
+        return orig(*args, **kwargs)
+
+    monkeypatch.setattr(r, "xrevrange", spy)
+    resp = client.get("/api/activity?limit=50")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [i["value"] for i in data["items"]] == [str(i) for i in range(9_999, 9_949, -1)]
+    # COUNT is pushed down to Redis instead of slicing the full stream
+    assert calls == [{"max": "+", "min": "-", "count": 50}]
@@ -1,37 +1,30 @@
 import subprocess
 
+IMAGE_BYTES = b"jpegdata"
+_CP_OK = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+_CP_FAIL = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="boom")
 
-def test_api_camera_snapshot_success(client, monkeypatch, tmp_path):
-    image_bytes = b"jpegdata"
 
-    class CP:
-        returncode = 0
-        stdout = ""
-        stderr = ""
+def _fake_run_ok(cmd, **kwargs):
+    with open(cmd[-1], "wb") as fh:
+        fh.write(IMAGE_BYTES)
+    return _CP_OK
 
-    def fake_run(cmd, capture_output=None, text=None, check=None):
-        output_path = cmd[-1]
-        with open(output_path, "wb") as fh:
-            fh.write(image_bytes)
-        return CP()
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+def _fake_run_fail(cmd, **kwargs):
+    return _CP_FAIL
+
+
+def test_api_camera_snapshot_success(client, monkeypatch):
+    monkeypatch.setattr(subprocess, "run", _fake_run_ok)
     resp = client.post("/api/cameras/snapshot", json={"url": "rtsp://example"})
     assert resp.status_code == 200
-    assert resp.content == image_bytes
+    assert resp.content == IMAGE_BYTES
     assert resp.headers["content-type"] == "image/jpeg"
 
 
 def test_api_camera_snapshot_failure(client, monkeypatch):
-    class CP:
-        returncode = 1
-        stdout = ""
-        stderr = "boom"
-
-    def fake_run(cmd, capture_output=None, text=None, check=None):
-        return CP()
-
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "run", _fake_run_fail)
     resp = client.post("/api/cameras/snapshot", json={"url": "rtsp://example"})
     assert resp.status_code == 400
     assert resp.json()["error"] == "snapshot failed"
@@ -1,27 +1,28 @@
 import asyncio
-import threading
 import time
 
-import fakeredis
+import pytest
 from loguru import logger
 
 from routers import cameras
 from schemas.camera import CameraCreate, Orientation
 
 
-def setup_function(func):
+@pytest.fixture(autouse=True)
+def _cameras_state(fake_redis):
     cameras.cams = []
     cameras.trackers_map = {}
     cameras.cfg = {"enable_person_tracking": True}
-    cameras.redis = fakeredis.FakeRedis(decode_responses=True)
+    cameras.redis = fake_redis
 
 
 def test_create_camera_start_async_and_mask(monkeypatch):
-    called = threading.Event()
+    called = asyncio.Event()
+    loop = None
 
     def fake_start_tracker(*a, **k):
-        time.sleep(0.1)
-        called.set()
+        # runs in the ``asyncio.to_thread`` worker, so hand the signal back
+        loop.call_soon_threadsafe(called.set)
 
     monkeypatch.setattr(cameras, "start_tracker", fake_start_tracker)
     logs = []
@@ -36,10 +37,12 @@ def test_create_camera_start_async_and_mask(monkeypatch):
     )
 
     async def _run():
+        nonlocal loop
+        loop = asyncio.get_running_loop()
         start = time.perf_counter()
         res = await cameras.create_camera_api(cam)
         elapsed = time.perf_counter() - start
-        await asyncio.sleep(0.2)
+        await asyncio.wait_for(called.wait(), 1)
         return res, elapsed
 
     try:
@@ -47,7 +50,7 @@ def test_create_camera_start_async_and_mask(monkeypatch):
     finally:
         logger.remove(handle)
     assert result["id"] == 1
-    assert called.wait(1)
+    assert called.is_set()
     assert elapsed < 0.2
     joined = "".join(logs)
     assert "user:pass" not in joined
@@ -80,3 +83,21 @@ def test_create_camera_without_roi():
     cam = CameraCreate(name="Cam1", url="rtsp://example/stream", inout_count=True)
     res = asyncio.run(cameras.create_camera_api(cam))
     assert "line" not in res
+
+
+def test_delete_camera_leaves_prefix_sibling(monkeypatch):
+    r = cameras.redis
+    cameras.cams = [{"id": 1}, {"id": 10}]
+    monkeypatch.setattr(cameras, "save_cameras", lambda *a, **k: None)
+    monkeypatch.setattr(cameras, "delete_camera_model", lambda *a, **k: None)
+    monkeypatch.setattr(cameras.camera_manager, "stop_tracker_fn", lambda *a, **k: None)
+    for cid in (1, 10):
+        r.hset(f"camera:{cid}", "status", "online")
+        r.hset(f"camera:{cid}:health", "status", "online")
+        r.set(f"camera_profile:{cid}", "p")
+
+    res = asyncio.run(cameras.delete_camera(1, None))
+
+    assert res == {"deleted": True}
+    assert not r.exists("camera:1", "camera:1:health", "camera_profile:1")
+    assert r.exists("camera:10", "camera:10:health", "camera_profile:10") == 3
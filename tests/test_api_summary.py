@@ -1,6 +1,6 @@
 from datetime import datetime
 
-import fakeredis
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -9,52 +9,58 @@ from routers import api_summary
 from utils.deps import get_redis
 
 
-def test_summary_fallback_to_events():
-    r = fakeredis.FakeRedis(decode_responses=True)
+@pytest.fixture(scope="module")
+def client(fake_redis):
     app = FastAPI()
-    app.dependency_overrides[get_redis] = lambda: r
+    app.dependency_overrides[get_redis] = lambda: fake_redis
     app.include_router(api_summary.router)
-    client = TestClient(app)
+    with TestClient(app) as c:
+        yield c
 
+
+def test_summary_fallback_to_events(client, fake_redis):
+    r = fake_redis
     r.hset(
         "summaries:2024-01-01",
         mapping={"in_person": 5, "out_person": 3, "in_vehicle": 2, "out_vehicle": 1},
     )
-    store = RedisStore(r)
     ts = int(datetime(2024, 1, 2, 12, 0, 0).timestamp())
-    for track_id in range(2):
-        store.persist_event(
-            ts_utc=ts + track_id,
-            ts_local="2024-01-02T12:00:00",
-            camera_id=1,
-            camera_name="cam",
-            track_id=track_id,
-            direction="in",
-            label="person",
-            image_path=None,
-            thumb_path=None,
-        )
-    store.persist_event(
-        ts_utc=ts + 2,
-        ts_local="2024-01-02T12:00:02",
-        camera_id=1,
-        camera_name="cam",
-        track_id=99,
-        direction="out",
-        label="person",
-        image_path=None,
-        thumb_path=None,
-    )
-    store.persist_event(
-        ts_utc=ts + 3,
-        ts_local="2024-01-02T12:00:03",
-        camera_id=1,
-        camera_name="cam",
-        track_id=100,
-        direction="in",
-        label="car",
-        image_path=None,
-        thumb_path=None,
+    base = {"camera_id": 1, "camera_name": "cam", "image_path": None, "thumb_path": None}
+    RedisStore(r).persist_events(
+        [
+            {
+                **base,
+                "ts_utc": ts,
+                "ts_local": "2024-01-02T12:00:00",
+                "track_id": 0,
+                "direction": "in",
+                "label": "person",
+            },
+            {
+                **base,
+                "ts_utc": ts + 1,
+                "ts_local": "2024-01-02T12:00:00",
+                "track_id": 1,
+                "direction": "in",
+                "label": "person",
+            },
+            {
+                **base,
+                "ts_utc": ts + 2,
+                "ts_local": "2024-01-02T12:00:02",
+                "track_id": 99,
+                "direction": "out",
+                "label": "person",
+            },
+            {
+                **base,
+                "ts_utc": ts + 3,
+                "ts_local": "2024-01-02T12:00:03",
+                "track_id": 100,
+                "direction": "in",
+                "label": "car",
+            },
+        ]
     )
 
     resp = client.get(
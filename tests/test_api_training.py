@@ -1,21 +1,21 @@
-import fakeredis
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from routers import api_training
 
 
-def _client():
-    r = fakeredis.FakeRedis()
-    api_training.init_context({}, r)
+@pytest.fixture(scope="module")
+def client(fake_redis):
     app = FastAPI()
     app.include_router(api_training.router)
-    api_training.require_roles = lambda request, roles: {"role": "admin"}
-    return TestClient(app), r
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(api_training, "require_roles", lambda request, roles: {"role": "admin"})
+        api_training.init_context({}, fake_redis)
+        yield TestClient(app)
 
 
-def test_start_and_status():
-    client, r = _client()
+def test_start_and_status(client):
     assert client.get("/api/training/status").json()["status"] == "idle"
     client.post("/api/training/start")
     assert client.get("/api/training/status").json()["status"] == "running"
@@ -4,8 +4,8 @@ import asyncio
 import io
 import json
 import sys
-import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import fakeredis
 from fastapi import FastAPI
@@ -16,19 +16,6 @@ from starlette.staticfiles import StaticFiles
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-sys.modules.setdefault(
-    "torch",
-    type(
-        "torch",
-        (),
-        {"cuda": type("cuda", (), {"is_available": staticmethod(lambda: False)})},
-    ),
-)
-sys.modules.setdefault("ultralytics", type("ultralytics", (), {"YOLO": object}))
-sys.modules.setdefault("deep_sort_realtime", type("ds", (), {}))
-sys.modules["deep_sort_realtime.deepsort_tracker"] = type("t", (), {"DeepSort": object})
-sys.modules.setdefault("cv2", type("cv2", (), {}))
-
 from routers import settings
 
 
@@ -48,13 +35,15 @@ def setup(tmp_path):
     return cfg, r
 
 
-# make_image routine
-def make_image():
+# encode the logo fixture once at import
+def _make_image_bytes() -> bytes:
     img = Image.new("RGB", (200, 80), "red")
     buf = io.BytesIO()
     img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf
+    return buf.getvalue()
+
+
+_LOGO_PNG = _make_image_bytes()
 
 
 # Test logo upload
@@ -63,12 +52,15 @@ def test_logo_upload(tmp_path, monkeypatch):
     monkeypatch.setattr(settings, "LOGO_DIR", tmp_path / "static/logos")
     settings.LOGO_DIR.mkdir(parents=True)
     monkeypatch.setattr(settings, "require_roles", lambda r, roles: {"role": "admin"})
+    # the cache-buster is the upload second; step a fake clock instead of sleeping
+    clock = iter(range(1_700_000_000, 1_700_000_100))
+    monkeypatch.setattr(settings, "time", SimpleNamespace(time=lambda: next(clock)))
     app = FastAPI()
     app.post("/settings")(settings.update_settings)
     app.mount("/static", StaticFiles(directory=settings.LOGO_DIR.parent), name="static")
     client = TestClient(app)
 
-    buf = make_image()
+    buf = io.BytesIO(_LOGO_PNG)
     files = {"logo": ("logo.png", buf, "image/png")}
     resp = client.post("/settings", data={"password": "pass", "company_name": "A"}, files=files)
     assert resp.status_code == 200
@@ -80,7 +72,6 @@ def test_logo_upload(tmp_path, monkeypatch):
     assert client.get(url1.split("?")[0]).status_code == 200
 
     buf.seek(0)
-    time.sleep(1)
     resp2 = client.post("/settings", data={"password": "pass", "company_name": "A"}, files=files)
     url2 = cfg["branding"]["company_logo_url"]
     assert url1 != url2
@@ -1,3 +1,5 @@
+import asyncio
+
 import numpy as np
 
 from routers import cameras
@@ -34,7 +36,6 @@ def _patch(monkeypatch):
     monkeypatch.setattr(cameras, "FFmpegCameraStream", DummyStream)
     monkeypatch.setattr(cameras, "GstCameraStream", DummyStream)
     monkeypatch.setattr(cameras.cv2, "VideoCapture", DummyCap)
-    monkeypatch.setattr(cameras, "TEST_TOKENS", {})
     monkeypatch.setattr(
         cameras.cv2,
         "imencode",
@@ -44,18 +45,21 @@ def _patch(monkeypatch):
     return DummyStream
 
 
-def test_camera_add_flow(client, monkeypatch):
+def test_camera_add_flow(asgi_client, monkeypatch):
     DummyStream = _patch(monkeypatch)
     cameras.cams = []
 
-    resp = client.get("/cameras/add")
-    assert resp.status_code == 200
+    async def _flow():
+        resp = await asgi_client.get("/cameras/add")
+        assert resp.status_code == 200
+
+        r = await asgi_client.post("/cameras/test", json={"url": "rtsp://demo"})
+        assert r.status_code == 200
+        assert DummyStream.kwargs["frame_skip"] == 1
+        assert r.json()["notes"].startswith("/api/cameras/preview?token=")
 
-    r = client.post("/cameras/test", json={"url": "rtsp://demo"})
-    assert r.status_code == 200
-    assert DummyStream.kwargs["frame_skip"] == 1
-    assert r.json()["notes"].startswith("/api/cameras/preview?token=")
+        resp = await asgi_client.post("/cameras", json={"name": "Cam1", "url": "rtsp://demo"})
+        assert resp.status_code == 200
 
-    resp = client.post("/cameras", json={"name": "Cam1", "url": "rtsp://demo"})
-    assert resp.status_code == 200
+    asyncio.run(_flow())
     assert any(c["name"] == "Cam1" for c in cameras.cams)
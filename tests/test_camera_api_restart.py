@@ -1,4 +1,3 @@
-import threading
 from unittest.mock import Mock
 
 import routers.cameras as cameras
@@ -2,6 +2,10 @@ import numpy as np
 
 from routers import cameras
 
+# shared read-only frame returned by every fake read()
+_BLANK_HD = np.zeros((720, 1280, 3), dtype=np.uint8)
+_BLANK_HD.flags.writeable = False
+
 
 def _patch(monkeypatch):
     monkeypatch.setattr(
@@ -22,16 +26,16 @@ def _patch(monkeypatch):
             pass
 
         def read(self):
-            return True, np.zeros((720, 1280, 3), dtype=np.uint8)
+            return True, _BLANK_HD
+
+        _props = {
+            cameras.cv2.CAP_PROP_FRAME_WIDTH: 1280,
+            cameras.cv2.CAP_PROP_FRAME_HEIGHT: 720,
+            cameras.cv2.CAP_PROP_FPS: 30,
+        }
 
         def get(self, prop):
-            if prop == cameras.cv2.CAP_PROP_FRAME_WIDTH:
-                return 1280
-            if prop == cameras.cv2.CAP_PROP_FRAME_HEIGHT:
-                return 720
-            if prop == cameras.cv2.CAP_PROP_FPS:
-                return 30
-            return 0
+            return self._props.get(prop, 0)
 
         def release(self):
             pass
@@ -47,3 +51,14 @@ def test_camera_capabilities(client, monkeypatch):
     assert data["resolution"] == {"width": 1280, "height": 720}
     assert data["fps"] == 30
     assert data["license"]["ppe_detection"] is True
+
+
+def test_license_flags_follow_license_replacement(monkeypatch):
+    feats = {"ppe_detection": False}
+    monkeypatch.setattr(cameras, "cfg", {"license_info": {"features": feats}})
+    first = cameras._license_flags()
+    assert first["ppe_detection"] is False
+    assert cameras._license_flags() is first
+
+    cameras.cfg["license_info"] = {"features": {"ppe_detection": True}}
+    assert cameras._license_flags()["ppe_detection"] is True
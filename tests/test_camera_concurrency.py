@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 
 import routers.cameras as cameras
 
@@ -22,6 +23,7 @@ def _patch(monkeypatch):
     monkeypatch.setattr(cameras, "trackers_map", {})
     cameras.cams = []
     cameras.cams_lock = asyncio.Lock()
+    monkeypatch.setattr(cameras, "_cam_locks", defaultdict(asyncio.Lock))
     cameras.redis = type("R", (), {"hget": lambda *a, **k: "", "hset": lambda *a, **k: None})()
 
 
@@ -65,3 +67,49 @@ def test_concurrent_toggle_show(monkeypatch):
 
     asyncio.run(runner())
     assert cameras.cams[0]["show"] is False
+
+
+def test_toggle_show_not_blocked_by_list_lock(monkeypatch):
+    _patch(monkeypatch)
+    cameras.cams = [{"id": 1, "show": False}, {"id": 2, "show": False}]
+
+    async def runner():
+        # a list-level operation holding cams_lock must not stall per-camera edits
+        async with cameras.cams_lock:
+            return await asyncio.wait_for(cameras.toggle_show(2, DummyRequest()), 1)
+
+    assert asyncio.run(runner()) == {"show": True}
+
+
+def test_update_during_probe_does_not_edit_deleted_camera(monkeypatch):
+    _patch(monkeypatch)
+    monkeypatch.setattr(cameras, "redis", None)
+    monkeypatch.setattr(cameras, "delete_camera_model", lambda *a, **k: None)
+    monkeypatch.setattr(cameras.camera_manager, "stop_tracker_fn", lambda *a, **k: None)
+    cameras.cams = [{"id": 1, "url": "rtsp://test", "tasks": [], "resolution": "720p"}]
+    saved = []
+    monkeypatch.setattr(cameras, "save_cameras", lambda cams, r: saved.append(list(cams)))
+    probing = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_resolve(url, res, timeout=None):
+        probing.set()
+        await release.wait()
+        return "1080p"
+
+    monkeypatch.setattr(cameras, "_resolve_resolution", slow_resolve)
+
+    async def runner():
+        update = asyncio.create_task(
+            cameras.update_camera(1, DummyRequest({"resolution": "1080p"}), cameras.camera_manager)
+        )
+        await probing.wait()
+        deleted = await asyncio.wait_for(cameras.delete_camera(1, DummyRequest()), 1)
+        release.set()
+        return deleted, await update
+
+    deleted, updated = asyncio.run(runner())
+    assert deleted == {"deleted": True}
+    assert updated == {"error": "Not found"}
+    assert cameras.cams == []
+    assert saved == [[]]
@@ -29,7 +29,7 @@ async def client(tmp_path, monkeypatch):
             "enabled": True,
         }
     ]
-    r = fakeredis.FakeRedis()
+    r = fakeredis.FakeRedis(decode_responses=True)
     cameras.init_context(cfg, cams, {}, r, str(tmp_path))
     monkeypatch.setattr(cameras, "require_roles", lambda r, roles: {"role": "admin"})
 
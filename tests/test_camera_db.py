@@ -8,9 +8,13 @@ from models import camera as camera_model
 from models.camera import Orientation, Transport, get_camera
 from routers import cameras
 
+# shared read-only frame returned by every fake read()
+_TINY = np.zeros((1, 1, 3), dtype=np.uint8)
+_TINY.flags.writeable = False
+
 
 def _patch(monkeypatch):
-    r = fakeredis.FakeRedis()
+    r = fakeredis.FakeRedis(decode_responses=True)
     monkeypatch.setattr(cameras, "save_cameras", lambda *a, **k: None)
     monkeypatch.setattr(cameras, "start_tracker", lambda *a, **k: None)
     monkeypatch.setattr(cameras, "cfg", {"license_info": {"features": {}}}, raising=False)
@@ -29,10 +33,10 @@ def _patch(monkeypatch):
             DummyStream.kwargs = k
 
         def wait_first_frame(self, *a, **k):
-            return np.zeros((1, 1, 3), dtype=np.uint8)
+            return _TINY
 
         def read(self):
-            return True, np.zeros((1, 1, 3), dtype=np.uint8)
+            return True, _TINY
 
         def release(self):
             pass
@@ -42,7 +46,7 @@ def _patch(monkeypatch):
             pass
 
         def read(self):
-            return True, np.zeros((1, 1, 3), dtype=np.uint8)
+            return True, _TINY
 
         def release(self):
             pass
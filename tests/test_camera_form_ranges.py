@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 from bs4 import BeautifulSoup
@@ -5,17 +6,19 @@ from bs4 import BeautifulSoup
 ROOT = Path(__file__).resolve().parents[1]
 
 
-def test_camera_form_has_input_ranges():
+@functools.cache
+def _input_ranges() -> dict[str, tuple[str | None, str | None]]:
+    """Parse ``cameras.html`` once and map each named input to its (min, max)."""
     html = (ROOT / "templates" / "cameras.html").read_text()
     soup = BeautifulSoup(html, "html.parser")
+    return {
+        tag["name"]: (tag.get("min"), tag.get("max"))
+        for tag in soup.find_all("input", attrs={"name": True})
+    }
 
-    timeout = soup.find("input", {"name": "ready_timeout"})
-    frames = soup.find("input", {"name": "ready_frames"})
-    duration = soup.find("input", {"name": "ready_duration"})
 
-    assert timeout["min"] == "0"
-    assert timeout["max"] == "60"
-    assert frames["min"] == "1"
-    assert frames["max"] == "1000"
-    assert duration["min"] == "0"
-    assert duration["max"] == "60"
+def test_camera_form_has_input_ranges():
+    ranges = _input_ranges()
+    assert ranges["ready_timeout"] == ("0", "60")
+    assert ranges["ready_frames"] == ("1", "1000")
+    assert ranges["ready_duration"] == ("0", "60")
@@ -11,22 +11,26 @@ class DummyTracker:
         return {"latency": 0.5, "frame_ts": 123.0, "packet_loss": 7}
 
 
+class _Stop(Exception):
+    """Break out of the loop; StopIteration would surface as RuntimeError."""
+
+
 def _stop_sleep(*args, **kwargs):
-    raise StopIteration
+    raise _Stop
 
 
 def test_health_loop_populates_redis(monkeypatch):
-    r = fakeredis.FakeRedis()
+    r = fakeredis.FakeRedis(decode_responses=True)
     monkeypatch.setattr(cameras, "cams", [{"id": 1}], raising=False)
     monkeypatch.setattr(cameras, "trackers_map", {1: DummyTracker()}, raising=False)
     monkeypatch.setattr(cameras, "redis", r, raising=False)
     monkeypatch.setattr(cameras.asyncio, "sleep", _stop_sleep)
-    with pytest.raises(StopIteration):
+    with pytest.raises(_Stop):
         asyncio.run(cameras._health_loop())
     data = r.hgetall("camera:1:health")
-    assert float(data[b"latency"]) == 0.5
-    assert float(data[b"frame_ts"]) == 123.0
-    assert int(data[b"packet_loss"]) == 7
+    assert float(data["latency"]) == 0.5
+    assert float(data["frame_ts"]) == 123.0
+    assert int(data["packet_loss"]) == 7
 
 
 def test_collect_health():
@@ -37,12 +41,25 @@ def test_collect_health():
 
 
 def test_health_loop_handles_missing_tracker(monkeypatch):
-    r = fakeredis.FakeRedis()
+    r = fakeredis.FakeRedis(decode_responses=True)
     monkeypatch.setattr(cameras, "cams", [{"id": 1}, {"id": 2}], raising=False)
     monkeypatch.setattr(cameras, "trackers_map", {1: DummyTracker()}, raising=False)
     monkeypatch.setattr(cameras, "redis", r, raising=False)
     monkeypatch.setattr(cameras.asyncio, "sleep", _stop_sleep)
-    with pytest.raises(StopIteration):
+    with pytest.raises(_Stop):
         asyncio.run(cameras._health_loop())
     assert r.hgetall("camera:1:health")
     assert r.hgetall("camera:2:health") == {}
+
+
+def test_health_loop_idle_without_trackers(monkeypatch):
+    class _NoRedis:
+        def pipeline(self, *args, **kwargs):
+            raise AssertionError("redis touched with no trackers")
+
+    monkeypatch.setattr(cameras, "cams", [{"id": 1}], raising=False)
+    monkeypatch.setattr(cameras, "trackers_map", {}, raising=False)
+    monkeypatch.setattr(cameras, "redis", _NoRedis(), raising=False)
+    monkeypatch.setattr(cameras.asyncio, "sleep", _stop_sleep)
+    with pytest.raises(_Stop):
+        asyncio.run(cameras._health_loop())
@@ -33,3 +33,19 @@ async def test_snapshot_uses_cached_frame():
     assert ok is True
     assert detail == "from_cache"
     assert np.array_equal(got, frame)
+
+
+async def test_concurrent_starts_launch_one_tracker():
+    cams = [{"id": 1, "url": "", "tasks": []}]
+    trackers = {}
+    calls = []
+
+    def start(cam, cfg, trackers, r, cb=None):
+        calls.append(cam["id"])
+        trackers[cam["id"]] = object()
+        return trackers[cam["id"]]
+
+    mgr = CameraManager({}, trackers, None, lambda: cams, start, lambda cid, tr: None)
+
+    await asyncio.gather(mgr.start(1), mgr.start(1), mgr.start(1))
+    assert calls == [1]
@@ -19,7 +19,6 @@ def test_start_tracker_sets_redis_online():
     mgr = CameraManager(
         {},
         trackers,
-        {},
         r,
         lambda: cams,
         start_tracker,
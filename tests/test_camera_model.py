@@ -0,0 +1,23 @@
+import pytest
+
+from models.camera import Camera, Orientation, Transport, _deserialize, _serialize
+
+
+def test_deserialize_round_trip_restores_enums():
+    cam = Camera(
+        id="c1",
+        name="Cam",
+        url="rtsp://x",
+        orientation=Orientation.horizontal,
+        transport=Transport.udp,
+    )
+    row = _deserialize(_serialize(cam))
+    assert row.orientation is Orientation.horizontal
+    assert row.transport is Transport.udp
+
+
+def test_deserialize_rejects_unknown_orientation():
+    data = _serialize(Camera(id="c1", name="Cam", url="rtsp://x"))
+    data["orientation"] = "diagonal"
+    with pytest.raises(ValueError):
+        _deserialize(data)
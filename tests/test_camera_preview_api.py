@@ -4,40 +4,43 @@ import fakeredis
 import pytest
 from fakeredis.aioredis import FakeRedis as AsyncFakeRedis
 
-import app
 from routers import cameras
 from utils import redis as redis_utils
 
+_SYNC = fakeredis.FakeRedis(decode_responses=True)
+_ASYNC = AsyncFakeRedis(decode_responses=True)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def _patch_redis():  # pragma: no cover - test setup helper
     mp = pytest.MonkeyPatch()
-    mp.setattr(
-        redis_utils,
-        "get_sync_client",
-        lambda url=None: fakeredis.FakeRedis(decode_responses=True),
-    )
+    mp.setattr(redis_utils, "get_sync_client", lambda url=None: _SYNC)
 
     async def _fake_get_client(url: str | None = None):
-        return AsyncFakeRedis(decode_responses=True)
+        return _ASYNC
 
     mp.setattr(redis_utils, "get_client", _fake_get_client)
-    mp.setattr(
-        app,
-        "get_sync_client",
-        lambda url=None: fakeredis.FakeRedis(decode_responses=True),
-    )
     yield
     mp.undo()
 
 
+@pytest.fixture(autouse=True)
+def _flush_fake_clients():
+    yield
+    _SYNC.flushall()
+    asyncio.run(_ASYNC.flushall())
+
+
 class _DummyProc:
     def __init__(self):
         self.returncode = None
 
-    async def communicate(self):  # pragma: no cover - simple helper
+    def communicate(self):  # pragma: no cover - simple helper
+        # an already-resolved future is awaitable without running a coroutine
         self.returncode = 0
-        return b"frame", b""
+        fut = asyncio.get_running_loop().create_future()
+        fut.set_result((b"frame", b""))
+        return fut
 
     def kill(self):  # pragma: no cover - simple helper
         self.returncode = -9
@@ -51,7 +54,6 @@ async def _fake_exec(*cmd, **kw):  # pragma: no cover - used in tests
 
 
 def test_api_camera_test_returns_token(client, monkeypatch):
-    monkeypatch.setattr(cameras, "PREVIEW_TOKENS", {})
     monkeypatch.setattr(
         cameras,
         "probe_rtsp",
@@ -70,7 +72,6 @@ def test_api_camera_test_returns_token(client, monkeypatch):
 
 
 def test_api_camera_preview_frame(client, monkeypatch):
-    monkeypatch.setattr(cameras, "PREVIEW_TOKENS", {})
     monkeypatch.setattr(asyncio, "create_subprocess_exec", _fake_exec)
     monkeypatch.setattr(
         cameras,
@@ -100,7 +101,6 @@ class _FullSem:
 
 
 def test_api_camera_preview_limit(client, monkeypatch):
-    monkeypatch.setattr(cameras, "PREVIEW_TOKENS", {})
     monkeypatch.setattr(cameras, "preview_semaphore", _FullSem())
     monkeypatch.setattr(
         cameras,
@@ -1,147 +1,115 @@
-import io
-import subprocess
-import time
+import asyncio
 
 import numpy as np
+import pytest
 
 from routers import cameras
 
+_BLANK_FRAME = np.zeros((1, 1, 3), dtype=np.uint8)
+_BLANK_FRAME.flags.writeable = False
+_JPEG = b"\xff\xd8jpeg"
 
-def _patch(monkeypatch):
-    monkeypatch.setattr(cameras, "cfg", {})
-    monkeypatch.setattr(cameras, "TEST_STREAMS", {})
-    monkeypatch.setattr(cameras, "TEST_CAMERA_PROBES", {})
-    monkeypatch.setattr(cameras, "TEST_TOKENS", {})
 
-    class DummyStream:
-        def __init__(self, *a, **k):
-            DummyStream.kwargs = k
-            if a:
-                DummyStream.kwargs["url"] = a[0]
+class DummySource:
+    """``RtspFfmpegSource`` stand-in that records how it was opened."""
 
-        def wait_first_frame(self, *a, **k):
-            return np.zeros((1, 1, 3), dtype=np.uint8)
+    calls: list[tuple[str, bool]] = []
+    frame = _BLANK_FRAME
 
-        def read(self, *a, **k):
+    def __init__(self, uri, *, tcp=True, **k):
+        DummySource.calls.append((uri, tcp))
 
-            return True, np.zeros((1, 1, 3), dtype=np.uint8)
+    def open(self):
+        pass
 
-        def release(self):
-            pass
+    def read(self):
+        return self.frame
 
-    monkeypatch.setattr(cameras, "FFmpegCameraStream", DummyStream)
-    monkeypatch.setattr(cameras, "GstCameraStream", DummyStream)
-    return DummyStream
+    def close(self):
+        pass
 
 
-def _patch_fail(monkeypatch):
-    monkeypatch.setattr(cameras, "cfg", {})
-    monkeypatch.setattr(cameras, "TEST_STREAMS", {})
-    monkeypatch.setattr(cameras, "TEST_CAMERA_PROBES", {})
-    monkeypatch.setattr(cameras, "TEST_TOKENS", {})
+class FailSource(DummySource):
+    frame = None
+
 
-    class FailStream:
-        def __init__(self, *a, **k):
-            self.last_status = "error"
-            self.last_error = "boom"
-            self.last_stderr = "fail"
+class DummyProc:
+    returncode = 0
 
-        def read(self):
-            return False, None
+    async def communicate(self):
+        return _JPEG, b""
 
-        def release(self):
-            pass
+    def kill(self):
+        pass
 
-    monkeypatch.setattr(cameras, "FFmpegCameraStream", FailStream)
-    monkeypatch.setattr(cameras, "GstCameraStream", FailStream)
-    return FailStream
+    async def wait(self):
+        return 0
+
+
+@pytest.fixture(autouse=True)
+def _reset_dummy_source():
+    DummySource.calls = []
+    yield
+
+
+def _patch(monkeypatch, source=DummySource):
+    monkeypatch.setattr(cameras, "cfg", {})
+    monkeypatch.setattr(cameras, "RtspFfmpegSource", source)
+    monkeypatch.setattr(cameras, "encode_jpeg", lambda frame: _JPEG)
+    # the session ``client`` fixture stubs create_task; the probe needs real tasks
+    monkeypatch.setattr(asyncio, "create_task", asyncio.tasks.create_task)
 
 
 def test_camera_preview_stream(client, monkeypatch):
-    DummyStream = _patch(monkeypatch)
+    _patch(monkeypatch)
     r = client.post("/cameras/test", json={"url": "rtsp://demo", "stream": True})
     assert r.status_code == 200
-    assert DummyStream.kwargs["frame_skip"] == 1
-    assert DummyStream.kwargs["test"] is True
-    assert DummyStream.kwargs["url"] == "rtsp://demo?subtype=1"
-    assert DummyStream.kwargs.get("downscale") is None
+    assert DummySource.calls == [("rtsp://demo?subtype=1", True)]
     notes = r.json()["notes"]
     assert notes.startswith("/api/cameras/preview?token=")
 
 
-def test_camera_preview_stream_downscale(client, monkeypatch):
-    DummyStream = _patch(monkeypatch)
-    r = client.post("/cameras/test", json={"url": "rtsp://demo", "downscale": 2})
+def test_camera_preview_single_frame(client, monkeypatch):
+    _patch(monkeypatch)
+    r = client.post("/cameras/test", json={"url": "rtsp://demo?channel=2", "downscale": 2})
     assert r.status_code == 200
-    assert DummyStream.kwargs["downscale"] == 2
-    assert DummyStream.kwargs["test"] is True
-    assert DummyStream.kwargs["url"] == "rtsp://demo?subtype=1"
-    notes = r.json()["notes"]
-    assert notes.startswith("/api/cameras/preview?token=")
+    assert r.headers["content-type"] == "image/jpeg"
+    assert r.content == _JPEG
+    assert DummySource.calls == [("rtsp://demo?channel=2&subtype=1", True)]
 
 
 def test_camera_preview_stream_error(client, monkeypatch):
-    monkeypatch.setattr(cameras, "cfg", {})
-    monkeypatch.setattr(cameras, "TEST_CAMERA_TRANSPORT", {})
-
-    class FailStream:
-        def __init__(self, *a, **k):
-            self.last_status = "network"
-            self.last_error = "netfail"
-            self.last_stderr = "err\nrtsp://u:p@demo\nmore"
-            self.last_command = "ffmpeg -i rtsp://u:p@demo"
-
-        def read(self):
-            return False, None
-
-        def release(self):
-            pass
-
-    monkeypatch.setattr(cameras, "FFmpegCameraStream", FailStream)
-    monkeypatch.setattr(cameras, "GstCameraStream", FailStream)
+    _patch(monkeypatch, FailSource)
 
     r = client.post("/cameras/test", json={"url": "rtsp://demo"})
     assert r.status_code == 400
     data = r.json()
-    assert data["error"] == "netfail"
-    assert "***:***@" in data.get("ffmpeg_cmd", "")
-    assert "more" in data.get("stderr_tail", "")
+    assert data["error"] == "unable to read"
     assert data.get("transports") == ["tcp", "udp"]
+    assert [tcp for _, tcp in DummySource.calls] == [True, False]
     assert "suggestion" in data
 
 
 def test_preview_endpoint(client, monkeypatch):
-    DummyStream = _patch(monkeypatch)
-    r = client.post("/cameras/test", json={"url": "rtsp://demo"})
+    _patch(monkeypatch)
+    r = client.post("/cameras/test", json={"url": "rtsp://demo", "stream": True})
     token_url = r.json()["notes"]
 
-    class DummyProc:
-        def __init__(self, cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE):
-            self.cmd = cmd
-            self.stdout = io.BytesIO(b"--frame\r\n")
-            self.stderr = io.BytesIO(b"err")
-
-        def poll(self):
-            return 0
-
-        def kill(self):
-            pass
+    async def fake_exec(*cmd, **kwargs):
+        return DummyProc()
 
-    monkeypatch.setattr(cameras.subprocess, "Popen", DummyProc)
+    monkeypatch.setattr(cameras.asyncio, "create_subprocess_exec", fake_exec)
     resp = client.get(token_url)
     assert resp.status_code == 200
-    assert b"--frame" in resp.content
+    assert resp.content == _JPEG
+    # tokens are single use
+    assert client.get(token_url).status_code == 400
 
 
 def test_preview_limit(client, monkeypatch):
     _patch(monkeypatch)
-    cameras.TEST_STREAMS = {"a": object(), "b": object(), "c": object()}
-    token = "tok"
-    cameras.TEST_TOKENS[token] = {
-        "url": "rtsp://demo",
-        "transport": "tcp",
-        "expires": time.monotonic() + 60,
-    }
+    monkeypatch.setattr(cameras, "preview_semaphore", asyncio.Semaphore(0))
+    token = cameras._issue_preview_token("rtsp://demo")
     resp = client.get(f"/api/cameras/preview?token={token}")
-    assert resp.status_code == 429
+    assert resp.status_code == 409
     assert resp.json()["error"] == "Please close other previews"
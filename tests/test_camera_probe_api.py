@@ -1,4 +1,3 @@
-import shutil
 from urllib.parse import urlparse
 
 import pytest
@@ -9,8 +8,10 @@ from fastapi.testclient import TestClient
 from modules import stream_probe
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client() -> TestClient:
+    # endpoints look up stream_probe.probe_stream per request, so per-test
+    # monkeypatching still applies to the shared app
     app = FastAPI()
 
     @app.post("/cameras/probe")
@@ -43,7 +44,7 @@ def client() -> TestClient:
 
 
 @pytest.mark.parametrize(
-    "endpoint,payload,fake_result,extra_setup,check",
+    "endpoint,payload,fake_result,check",
     [
         (
             "/cameras/probe",
@@ -59,7 +60,6 @@ def client() -> TestClient:
                 "hwaccel": False,
                 "effective_fps": 29.7,
             },
-            lambda m: None,
             lambda d: (
                 d["details"]["codec"] == "h264"
                 and d["details"]["resolution"] == "640x480"
@@ -87,7 +87,6 @@ def client() -> TestClient:
                 "effective_fps": 19.6,
                 "elapsed": 8.02,
             },
-            lambda m: m.setattr(shutil, "which", lambda name: f"/usr/bin/{name}"),
             lambda d: (
                 d["parsed"]["host"] == "192.168.31.11"
                 and d["meta"]["width"] == 1280
@@ -102,14 +101,12 @@ def test_probe_endpoints(
     endpoint,
     payload,
     fake_result,
-    extra_setup,
     check,
 ):
     def fake_probe(url, sample_seconds=8, enable_hwaccel=True):
         return fake_result
 
     monkeypatch.setattr(stream_probe, "probe_stream", fake_probe)
-    extra_setup(monkeypatch)
     resp = client.post(endpoint, json=payload)
     assert resp.status_code == 200
     data = resp.json()
@@ -1,10 +1,12 @@
 import asyncio
-import time
+import threading
 
 import pytest
 
 from routers import cameras
 
+pytestmark = pytest.mark.anyio
+
 
 class DummyRequest:
     def __init__(self, data):
@@ -17,37 +19,43 @@ class DummyRequest:
         return False
 
 
-class SlowStream:
+class SlowSource:
+    """Capture source whose ``read`` blocks until the test releases it."""
+
+    gate = threading.Event()
+
     def __init__(self, *a, **k):
         pass
 
+    def open(self):
+        pass
+
     def read(self):
-        time.sleep(0.5)
-        return False, None
+        self.gate.wait(timeout=5)
+        return None
 
-    def release(self):
+    def close(self):
         pass
 
 
-def test_cancel_prior_probe(monkeypatch):
+async def test_cancel_prior_probe(monkeypatch):
     monkeypatch.setattr(cameras, "cfg", {})
-    monkeypatch.setattr(cameras, "TEST_CAMERA_TRANSPORT", {})
-    monkeypatch.setattr(cameras, "TEST_CAMERA_PROBES", {})
-    monkeypatch.setattr(cameras, "FFmpegCameraStream", SlowStream)
-    monkeypatch.setattr(cameras, "GstCameraStream", SlowStream)
-
-    async def _run():
-        req1 = DummyRequest({"url": "rtsp://demo"})
-        task1 = asyncio.create_task(cameras.test_camera(req1))
-        await asyncio.sleep(0.1)
+    monkeypatch.setattr(cameras, "RtspFfmpegSource", SlowSource)
+    # the session ``client`` fixture stubs create_task; this test needs real tasks
+    monkeypatch.setattr(asyncio, "create_task", asyncio.tasks.create_task)
+    SlowSource.gate.clear()
 
-        req2 = DummyRequest({"url": "rtsp://demo"})
-        task2 = asyncio.create_task(cameras.test_camera(req2))
+    req1 = DummyRequest({"url": "rtsp://demo"})
+    task1 = asyncio.create_task(cameras.test_camera(req1))
+    await asyncio.sleep(0)
 
-        resp2 = await task2
-        assert resp2.status_code == 400
+    req2 = DummyRequest({"url": "rtsp://demo"})
+    task2 = asyncio.create_task(cameras.test_camera(req2))
+    await asyncio.sleep(0)
+    SlowSource.gate.set()
 
-        with pytest.raises(asyncio.CancelledError):
-            await task1
+    resp2 = await task2
+    assert resp2.status_code == 400
 
-    asyncio.run(_run())
+    with pytest.raises(asyncio.CancelledError):
+        await task1
@@ -1,20 +1,20 @@
 """Test that updating a camera restarts its tracker."""
 
-import threading
+import queue
 
 import routers.cameras as cameras
 
 
 def test_camera_restart(client, monkeypatch):
     calls = {}
-    started = threading.Event()
+    started: queue.Queue[int] = queue.Queue()
 
     def fake_stop(cam_id, trackers):
         calls["stop"] = cam_id
 
     def fake_start(cam, cfg, trackers, redis):
         calls["start"] = cam["id"]
-        started.set()
+        started.put(cam["id"])
         return object()
 
     monkeypatch.setattr(cameras, "stop_tracker", fake_stop)
@@ -31,5 +31,5 @@ def test_camera_restart(client, monkeypatch):
     assert data["updated"] is True
     assert data["restarted"] is True
     assert calls.get("stop") == cam_id
-    assert started.wait(1)
+    assert started.get(timeout=0.5) == cam_id
     assert calls.get("start") == cam_id
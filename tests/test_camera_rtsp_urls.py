@@ -1,41 +1,44 @@
-import logging
+import asyncio
 
 import numpy as np
 
 from routers import cameras
 
-logger = logging.getLogger(__name__)
+_BLANK_FRAME = np.zeros((1, 1, 3), dtype=np.uint8)
+_BLANK_FRAME.flags.writeable = False
 
 
-class DummyStream:
+class DummySource:
+    """``RtspFfmpegSource`` stand-in returning one shared read-only frame."""
+
     calls = []
 
-    def __init__(self, *a, **k):
-        self.last_status = "ok"
-        self.last_error = ""
-        DummyStream.calls.append(k)
+    def __init__(self, uri, **k):
+        DummySource.calls.append(uri)
 
-    def wait_first_frame(self, *a, **k):
-        return np.zeros((1, 1, 3), dtype=np.uint8)
+    def open(self):
+        pass
 
     def read(self):
-        return True, np.zeros((1, 1, 3), dtype=np.uint8)
+        return _BLANK_FRAME
 
-    def release(self):
+    def close(self):
         pass
 
 
 def test_rtsp_urls_preview(client, monkeypatch):
-    monkeypatch.setattr(cameras, "FFmpegCameraStream", DummyStream)
-    monkeypatch.setattr(cameras, "GstCameraStream", DummyStream)
-    monkeypatch.setattr(cameras, "TEST_TOKENS", {})
+    monkeypatch.setattr(cameras, "RtspFfmpegSource", DummySource)
+    monkeypatch.setattr(cameras, "encode_jpeg", lambda frame: b"jpeg")
+    # the session ``client`` fixture stubs create_task; the probe needs real tasks
+    monkeypatch.setattr(asyncio, "create_task", asyncio.tasks.create_task)
+    DummySource.calls = []
 
     urls = [
         "rtsp://cam1.example.com/stream",
         "rtsp://cam2.example.com/stream",
     ]
     for url in urls:
-        resp = client.post("/cameras/test", json={"url": url})
-        assert DummyStream.calls[-1]["frame_skip"] == 1
+        resp = client.post("/cameras/test", json={"url": url, "stream": True})
+        assert DummySource.calls[-1] == f"{url}?subtype=1"
         assert resp.status_code == 200
         assert resp.json()["notes"].startswith("/api/cameras/preview?token=")
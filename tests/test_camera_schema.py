@@ -4,6 +4,11 @@ from pydantic import ValidationError
 from schemas.camera import CameraCreate, CameraUpdate, Orientation, Point
 
 
+def test_schemas_are_complete():
+    # core schemas are built at class creation; nothing below should force a rebuild
+    assert CameraCreate.__pydantic_complete__ and CameraUpdate.__pydantic_complete__
+
+
 def test_url_type_validation():
     cam = CameraCreate(name="c1", url="rtsp://example")
     assert cam.type == "rtsp"
@@ -27,7 +32,7 @@ def test_line_optional_for_counting():
 def test_site_id_defaults(monkeypatch):
     import routers.cameras as rc
 
-    rc.cams = []
+    monkeypatch.setattr(rc, "cams", [])
     monkeypatch.setattr(rc, "cfg", {}, raising=False)
     cam = CameraCreate(name="c1", url="rtsp://a")
     assert cam.site_id == 1
@@ -36,7 +41,7 @@ def test_site_id_defaults(monkeypatch):
 def test_unique_name_per_site(monkeypatch):
     import routers.cameras as rc
 
-    rc.cams = [{"name": "CamX", "site_id": 1}]
+    monkeypatch.setattr(rc, "cams", [{"name": "CamX", "site_id": 1}])
     with pytest.raises(ValidationError):
         CameraCreate(name="CamX", url="rtsp://a", site_id=1)
 
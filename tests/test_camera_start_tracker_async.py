@@ -1,5 +1,8 @@
+import asyncio
 import threading
-import time
+
+import anyio
+import pytest
 
 import routers.cameras as cameras
 
@@ -19,12 +22,14 @@ def _base_camera():
     }
 
 
-def test_add_camera_starts_tracker_async(client, monkeypatch):
-    called = threading.Event()
+@pytest.mark.anyio
+async def test_add_camera_starts_tracker_async(asgi_client, monkeypatch):
+    loop = asyncio.get_running_loop()
+    called = asyncio.Event()
 
     def fake_start_tracker(*a, **k):
-        time.sleep(0.1)
-        called.set()
+        # runs in a worker thread; hand the signal back to the test's loop
+        loop.call_soon_threadsafe(called.set)
 
     monkeypatch.setattr(cameras, "start_tracker", fake_start_tracker)
     monkeypatch.setattr(cameras, "save_cameras", lambda *a, **k: None)
@@ -32,20 +37,19 @@ def test_add_camera_starts_tracker_async(client, monkeypatch):
     monkeypatch.setattr(cameras, "cfg", {"enable_person_tracking": True})
     monkeypatch.setattr(cameras, "trackers_map", {})
 
-    start = time.perf_counter()
-    resp = client.post("/cameras", json={"url": "rtsp://test", "enabled": True})
-    elapsed = time.perf_counter() - start
-    assert resp.status_code == 200
-    assert called.wait(1)
-    assert elapsed < 0.2
+    with anyio.fail_after(0.2):
+        resp = await asgi_client.post("/cameras", json={"url": "rtsp://test", "enabled": True})
+        assert resp.status_code == 200
+        await called.wait()
 
 
-def test_update_camera_restart_starts_tracker_async(client, monkeypatch):
-    called = threading.Event()
+@pytest.mark.anyio
+async def test_update_camera_restart_starts_tracker_async(asgi_client, monkeypatch):
+    loop = asyncio.get_running_loop()
+    called = asyncio.Event()
 
     def fake_start_tracker(*a, **k):
-        time.sleep(0.1)
-        called.set()
+        loop.call_soon_threadsafe(called.set)
 
     monkeypatch.setattr(cameras, "start_tracker", fake_start_tracker)
     monkeypatch.setattr(cameras, "save_cameras", lambda *a, **k: None)
@@ -54,12 +58,10 @@ def test_update_camera_restart_starts_tracker_async(client, monkeypatch):
     monkeypatch.setattr(cameras, "trackers_map", {})
     monkeypatch.setattr(cameras, "cams", [_base_camera()])
 
-    start = time.perf_counter()
-    resp = client.post("/camera/1", json={})
-    elapsed = time.perf_counter() - start
-    assert resp.status_code == 200
-    assert called.wait(1)
-    assert elapsed < 0.2
+    with anyio.fail_after(0.2):
+        resp = await asgi_client.post("/camera/1", json={})
+        assert resp.status_code == 200
+        await called.wait()
 
 
 def test_add_camera_disabled_does_not_start_tracker(client, monkeypatch):
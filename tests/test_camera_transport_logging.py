@@ -1,10 +1,15 @@
 import asyncio
 
 import numpy as np
-from loguru import logger
+import pytest
 
 from routers import cameras
 
+pytestmark = pytest.mark.anyio
+
+_BLANK_FRAME = np.zeros((1, 1, 3), dtype=np.uint8)
+_BLANK_FRAME.flags.writeable = False
+
 
 class DummyRequest:
     def __init__(self, data):
@@ -17,44 +22,32 @@ class DummyRequest:
         return False
 
 
-def test_camera_logs_selected_transport(monkeypatch):
+class DummySource:
+    """``RtspFfmpegSource`` stand-in that yields a frame on the first transport."""
+
+    def __init__(self, *a, **k):
+        pass
+
+    def open(self):
+        pass
+
+    def read(self):
+        return _BLANK_FRAME
+
+    def close(self):
+        pass
+
+
+async def test_camera_logs_selected_transport(monkeypatch, captured_logs):
     monkeypatch.setattr(cameras, "cfg", {}, raising=False)
-    monkeypatch.setattr(cameras, "TEST_CAMERA_TRANSPORT", {})
-    monkeypatch.setattr(cameras, "TEST_CAMERA_PROBES", {})
-
-    class DummyStream:
-        def __init__(self, *a, **k):
-            self.last_status = "ok"
-            self.last_error = ""
-            self.last_hint = ""
-            self.last_stderr = ""
-            self.last_command = ""
-
-        def read(self):
-            return True, np.zeros((1, 1, 3), dtype=np.uint8)
-
-        def wait_first_frame(self):
-            return np.zeros((1, 1, 3), dtype=np.uint8)
-
-        def release(self):
-            pass
-
-    monkeypatch.setattr(cameras, "FFmpegCameraStream", DummyStream)
-    monkeypatch.setattr(cameras, "GstCameraStream", DummyStream)
-    monkeypatch.setattr(
-        cameras.cv2,
-        "imencode",
-        lambda ext, frame: (True, np.array([1], dtype=np.uint8)),
-    )
-
-    logs = []
-    handle = logger.add(lambda m: logs.append(m), level="INFO")
-    try:
-        req = DummyRequest({"url": "rtsp://demo"})
-        resp = asyncio.run(cameras.test_camera(req))
-    finally:
-        logger.remove(handle)
+    monkeypatch.setattr(cameras, "RtspFfmpegSource", DummySource)
+    monkeypatch.setattr(cameras, "encode_jpeg", lambda frame: b"jpeg")
+    # the session ``client`` fixture stubs create_task; the probe needs real tasks
+    monkeypatch.setattr(asyncio, "create_task", asyncio.tasks.create_task)
+
+    req = DummyRequest({"url": "rtsp://demo"})
+    resp = await cameras.test_camera(req)
     assert resp.status_code == 200
-    joined = "".join(logs)
+    joined = "".join(captured_logs)
     assert "[test_camera] using TCP transport" in joined
     assert "'transport': 'tcp'" in joined
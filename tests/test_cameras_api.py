@@ -1,8 +1,6 @@
-import asyncio
 import sys
 from pathlib import Path
 
-import fakeredis
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
@@ -20,29 +18,12 @@ def anyio_backend():
     return "asyncio"
 
 
-class Buf:
-    def __init__(self, data: bytes = b"img"):
-        self._data = data
-
-    def tobytes(self) -> bytes:  # pragma: no cover - trivial
-        return self._data
-
-
-class CV2Stub:
-    CAP_PROP_FRAME_WIDTH = 3
-    CAP_PROP_FRAME_HEIGHT = 4
-    CAP_PROP_FPS = 5
-
-    @staticmethod
-    def imencode(ext, frame):  # pragma: no cover - trivial
-        return True, Buf()
-
-
 @pytest.fixture
-async def api_client(tmp_path, monkeypatch):
+async def api_client(tmp_path, monkeypatch, fake_redis):
     cfg = {}
     cams = []
-    r = fakeredis.FakeRedis()
+    # session client on the shared server; conftest flushes it around each test
+    r = fake_redis
     cameras.init_context(cfg, cams, {}, r, str(tmp_path))
     monkeypatch.setattr(cameras, "require_roles", lambda r, roles: {"role": "admin"})
     app = FastAPI()
@@ -53,30 +34,15 @@ async def api_client(tmp_path, monkeypatch):
 
 
 async def test_add_camera_persists_and_activates(api_client, monkeypatch):
-
     client, r, cams = api_client
+    probed = []
 
-    def ok_probe(*a, **k):
-        return {"ok": True}
-
-    monkeypatch.setattr(cameras, "check_rtsp", ok_probe)
-
-    class StreamStub:
-        def __init__(self, *a, **k):
-            self.last_status = "ok"
-            self.last_error = ""
-            self.last_hint = ""
-            self.last_stderr = ""
-            self.last_command = "cmd"
-
-        def read(self):
-            return True, object()
-
-        def release(self):
-            pass
+    def fake_probe_base(host, user, password):
+        probed.append(host)
+        return f"rtsp://{host}/stream"
 
-    monkeypatch.setattr(cameras, "FFmpegCameraStream", StreamStub)
-    monkeypatch.setattr(cameras, "cv2", CV2Stub)
+    # a URL without a path is completed by the RTSP base probe before saving
+    monkeypatch.setattr(cameras, "probe_rtsp_base", fake_probe_base)
 
     started = {}
 
@@ -84,11 +50,15 @@ async def test_add_camera_persists_and_activates(api_client, monkeypatch):
         started["id"] = cam_id
 
     monkeypatch.setattr(cameras.camera_manager, "start", fake_start)
+    # init_context binds the global config, which other tests may have edited
+    monkeypatch.setitem(cameras.cfg, "enable_person_tracking", True)
 
     resp = await client.post("/api/cameras", json={"name": "Cam", "url": "rtsp://example"})
     assert resp.status_code == 200
     cam_id = resp.json()["id"]
+    assert probed == ["example"]
     assert len(cams) == 1
+    assert cams[0]["url"] == "rtsp://example/stream"
     assert r.get("cameras") is not None
     assert started == {}
 
@@ -1,7 +1,7 @@
 """Purpose: Test capture buffer module."""
 
 import sys
-import time
+import types
 from pathlib import Path
 
 import numpy as np
@@ -10,14 +10,39 @@ import pytest
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from modules import base_camera
 from modules.base_camera import BaseCameraStream
 
 
+# FakeClock class stands in for wall time so capture runs without sleeping
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, dt):
+        self.now += dt
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(
+        base_camera, "time", types.SimpleNamespace(time=fake.time, sleep=fake.sleep)
+    )
+    return fake
+
+
 # DummyStream class encapsulates dummystream behavior
 class DummyStream(BaseCameraStream):
     # __init__ routine
     def __init__(self, fps=30, buffer_size=3, start_thread=True):
         self.fps = fps
+        self.budget = 0
+        # one frame buffer owned by the stream; read_latest hands out copies
+        self._frame = np.zeros((1, 1, 3), dtype=np.uint8)
         super().__init__(buffer_size, start_thread=start_thread)
 
     # _init_stream routine
@@ -26,30 +51,56 @@ class DummyStream(BaseCameraStream):
 
     # _read_frame routine
     def _read_frame(self):
-        time.sleep(1 / self.fps)
-        return True, np.zeros((1, 1, 3), dtype=np.uint8)
+        base_camera.time.sleep(1 / self.fps)
+        self.budget -= 1
+        if self.budget <= 0:
+            # stop the capture loop after this frame
+            self.running = False
+        return True, self._frame
 
     # _release_stream routine
     def _release_stream(self):
         pass
 
 
+# pump routine runs the real capture loop inline for ``seconds`` of fake time
+def _pump(stream, seconds):
+    stream.running = True
+    stream.budget = round(seconds * stream.fps)
+    stream._capture_loop()
+
+
 # Test capture buffer latency
-def test_capture_buffer_latency():
-    stream = DummyStream(fps=30, buffer_size=3)
-    time.sleep(0.2)
+def test_capture_buffer_latency(clock):
+    stream = DummyStream(fps=30, buffer_size=3, start_thread=False)
+    _pump(stream, 0.2)
     lags = []
     for _ in range(5):
-        time.sleep(0.2)
+        _pump(stream, 0.2)
+        # the consumer reads part-way through the next frame interval
+        clock.sleep(0.5 / stream.fps)
         ret, frame = stream.read_latest()
         assert ret
-        lag = time.time() - stream.last_ts
+        lag = clock.time() - stream.last_ts
         lags.append(lag)
-    assert stream.is_opened()
+    assert stream.initialized
+    assert len(stream.frames) == stream.buffer_size
     stream.release()
     assert max(lags) <= 3 / 30 + 0.1
 
 
+# Test the dummy stream hands back its one preallocated frame buffer
+@pytest.mark.parametrize("buffer_size", [1, 3])
+def test_read_frame_returns_same_buffer(clock, buffer_size):
+    stream = DummyStream(buffer_size=buffer_size, start_thread=False)
+    stream.budget = 2
+    _, frame1 = stream._read_frame()
+    _, frame2 = stream._read_frame()
+    assert frame1 is frame2
+    _pump(stream, 0.1)
+    assert all(frame is stream._frame for frame, _ in stream.frames)
+
+
 # Test abstract method enforcement and renamed API
 def test_base_camera_enforces_abstract_methods():
     class BadStream(BaseCameraStream):
@@ -1,14 +1,11 @@
-import fakeredis
-
 from config import CONFIG_DEFAULTS
 from config.storage import load_config
 
 
-def test_load_config_populates_defaults(tmp_path):
+def test_load_config_populates_defaults(tmp_path, fake_redis_raw):
     cfg_path = tmp_path / "cfg.json"
     cfg_path.write_text('{"redis_url": "redis://localhost:6379/0"}')
-    r = fakeredis.FakeRedis()
-    cfg = load_config(str(cfg_path), r)
+    cfg = load_config(str(cfg_path), fake_redis_raw)
     assert cfg["frame_skip"] == CONFIG_DEFAULTS["frame_skip"]
     assert cfg["ffmpeg_flags"] == CONFIG_DEFAULTS["ffmpeg_flags"]
     assert cfg["detector_fps"] == CONFIG_DEFAULTS["detector_fps"]
@@ -1,3 +1,5 @@
+import pytest
+
 from config import CONFIG_DEFAULTS
 from config.storage import _apply_defaults, _rewrite_pipelines
 
@@ -14,6 +16,19 @@ def test_apply_defaults_populates_and_normalizes():
     assert result["backend_priority"] == ["ffmpeg", "opencv"]
 
 
+def test_apply_defaults_keeps_present_values_and_copies_missing():
+    profiles = {"custom": {}}
+    result = _apply_defaults({"pipeline_profiles": profiles})
+    assert result["pipeline_profiles"] is profiles
+    assert result["users"] == CONFIG_DEFAULTS["users"]
+    assert result["users"] is not CONFIG_DEFAULTS["users"]
+
+
+def test_config_defaults_read_only():
+    with pytest.raises(TypeError):
+        CONFIG_DEFAULTS["frame_skip"] = 1
+
+
 def test_rewrite_pipelines_converts_legacy_fields():
     cfg = {"pipeline_profiles": {"cam": {"extra_pipeline": "foo", "ffmpeg_flags": "-bar"}}}
     _rewrite_pipelines(cfg)
@@ -1,7 +1,9 @@
 import json
+import os
 from datetime import date
+from types import SimpleNamespace
 
-import fakeredis
+import pytest
 import redis
 
 import core.tracker_manager as tm
@@ -11,14 +13,14 @@ from modules.events_store import RedisStore
 
 
 class DummyTracker:
-    def __init__(self):
+    def __init__(self, redis_client):
         self.in_counts = {"person": 1}
         self.out_counts = {"person": 0}
         self.in_count = 1
         self.out_count = 0
         self.tracks = set([1])
         self.prev_date = date.today()
-        self.redis = fakeredis.FakeRedis()
+        self.redis = redis_client
         self.key_in = "in"
         self.key_out = "out"
         self.key_date = "date"
@@ -27,19 +29,23 @@ class DummyTracker:
         self.post_process_loop = lambda: None
 
 
-def test_gather_stats():
-    r = fakeredis.FakeRedis()
-    for item in stats.ANOMALY_ITEMS:
-        r.set(f"{item}_count", 1)
-    tr = DummyTracker()
+@pytest.fixture
+def dummy_tracker(fake_redis_raw):
+    return DummyTracker(fake_redis_raw)
+
+
+def test_gather_stats(fake_redis_raw, dummy_tracker):
+    r = fake_redis_raw
+    r.mset(dict.fromkeys(stats.ANOMALY_COUNT_KEYS, 1))
+    tr = dummy_tracker
     data = stats.gather_stats({1: tr}, r, RedisStore(r))
     assert data["in_count"] == 0
     assert data["anomaly_counts"][stats.ANOMALY_ITEMS[0]] == 1
 
 
-def test_broadcast_stats(monkeypatch):
-    r = fakeredis.FakeRedis()
-    tr = DummyTracker()
+def test_broadcast_stats(monkeypatch, fake_redis_raw, dummy_tracker):
+    r = fake_redis_raw
+    tr = dummy_tracker
     published = {}
 
     def fake_publish(ch, msg):
@@ -52,6 +58,18 @@ def test_broadcast_stats(monkeypatch):
     assert "in_count" in published["msg"]
 
 
+def test_broadcast_stats_int_camera_keys(monkeypatch, fake_redis_raw, dummy_tracker):
+    r = fake_redis_raw
+    dummy_tracker.capture_source = type("Cap", (), {"first_frame_ms": 42})()
+    published = []
+    monkeypatch.setattr(r, "publish", lambda ch, msg: published.append(json.loads(msg)))
+    stats.broadcast_stats({1: dummy_tracker}, r, RedisStore(r))
+    assert published[0]["capture"]["first_frame_ms"] == {"1": 42}
+    # stored totals round-trip, so an unchanged second pass publishes nothing
+    stats.broadcast_stats({1: dummy_tracker}, r, RedisStore(r))
+    assert len(published) == 1
+
+
 def test_normalize_tasks():
     assert tm.normalize_tasks(None) == ["in_count", "out_count"]
     assert tm.normalize_tasks({"counting": {"in": True}, "ppe": ["helmet"]}) == [
@@ -60,24 +78,42 @@ def test_normalize_tasks():
     ]
 
 
-def test_load_and_save_cameras():
-    r = fakeredis.FakeRedis()
+def test_load_and_save_cameras(fake_redis_raw):
+    r = fake_redis_raw
     cams = [{"id": 1, "url": "rtsp://", "tasks": {"counting": {"in": True}}}]
     tm.save_cameras(cams, r)
     loaded = tm.load_cameras(r, "")
     assert loaded[0]["tasks"] == ["in_count"]
 
 
-def test_reset_counts():
-    tr = DummyTracker()
+def test_reset_counts(dummy_tracker):
+    tr = dummy_tracker
     tm.reset_counts({1: tr})
     assert tr.in_count == 0 and tr.out_count == 0
     assert tr.redis.get("in") == b"0"
 
 
-def test_log_counts(monkeypatch):
-    r = fakeredis.FakeRedis()
-    tr = DummyTracker()
+def test_reset_counts_batches_shared_client(monkeypatch, fake_redis_raw, dummy_tracker):
+    r = fake_redis_raw
+    other = DummyTracker(r)
+    other.key_in, other.key_out, other.key_date = "in2", "out2", "date2"
+    r.set("in2", 5)
+    calls = []
+    real_mset = r.mset
+
+    def recording_mset(mapping):
+        calls.append(mapping)
+        return real_mset(mapping)
+
+    monkeypatch.setattr(r, "mset", recording_mset)
+    tm.reset_counts({1: dummy_tracker, 2: other})
+    assert len(calls) == 1
+    assert r.get("in2") == b"0"
+
+
+def test_log_counts(monkeypatch, fake_redis_raw, dummy_tracker):
+    r = fake_redis_raw
+    tr = dummy_tracker
     called = {}
 
     def fake_broadcast(trackers, r, store):
@@ -105,6 +141,40 @@ def test_load_branding_defaults(tmp_path):
     assert data["company_name"]
 
 
+def test_load_branding_cached_hits(tmp_path, monkeypatch):
+    path = tmp_path / "branding.json"
+    save_branding({"company_name": "X"}, str(path))
+    calls = []
+    real_load = json.load
+
+    def counting_load(f):
+        calls.append(f)
+        return real_load(f)
+
+    monkeypatch.setattr(json, "load", counting_load)
+    first = load_branding(str(path))
+    with pytest.raises(TypeError):
+        first["company_name"] = "mutated"
+    assert load_branding(str(path))["company_name"] == "X"
+    assert len(calls) == 1
+    save_branding({"company_name": "Y"}, str(path))
+    assert load_branding(str(path))["company_name"] == "Y"
+    assert len(calls) == 2
+
+
+def test_load_branding_reads_file_with_zero_inode(tmp_path, monkeypatch):
+    path = tmp_path / "branding.json"
+    save_branding({"company_name": "Z"}, str(path))
+    real_stat = os.stat
+
+    def fat_stat(p, *a, **k):
+        st = real_stat(p, *a, **k)
+        return SimpleNamespace(st_mtime_ns=st.st_mtime_ns, st_size=st.st_size, st_ino=0)
+
+    monkeypatch.setattr(os, "stat", fat_stat)
+    assert load_branding(str(path))["company_name"] == "Z"
+
+
 def test_save_branding(tmp_path):
     path = tmp_path / "branding.json"
     save_branding({"company_name": "X"}, str(path))
@@ -114,7 +184,6 @@ def test_save_branding(tmp_path):
 
 
 def test_reset_backoff():
-    tr = DummyTracker()
     tm.tracker_threads[1] = {"restart_attempts": 3}
     tm.reset_backoff(1)
     assert tm.tracker_threads[1]["restart_attempts"] == 0
@@ -1,43 +1,66 @@
 import asyncio
 from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
 
-import fakeredis
+import pytest
 
+import core.tracker_manager as tm
 from config import set_config
 from core.tracker_manager import counter_config_listener
 from modules.tracker import PersonTracker
 
+pytestmark = pytest.mark.anyio
 
-def test_counter_config_updates_tracker():
-    r = fakeredis.FakeRedis()
+
+@dataclass
+class TrackerStub:
+    """Counter state read by ``_apply_counter_config``; ``update_cfg`` is the real one."""
+
+    redis: Any
+    cam_id: int = 1
+    line_orientation: str = "vertical"
+    line_ratio: float = 0.5
+    groups: list = field(default_factory=lambda: ["person"])
+    in_counts: dict = field(default_factory=lambda: {"person": 0})
+    out_counts: dict = field(default_factory=lambda: {"person": 0})
+    key_in: str = "person_tracker:cam:1:in"
+    key_out: str = "person_tracker:cam:1:out"
+    cfg: dict = field(default_factory=dict)
+
+    update_cfg = PersonTracker.update_cfg
+
+
+@pytest.mark.parametrize("client", ["fake_redis_raw", "fake_redis"])
+async def test_counter_config_updates_tracker(client, request, monkeypatch):
+    r = request.getfixturevalue(client)
     set_config({"track_objects": []})
-    tr = PersonTracker.__new__(PersonTracker)
-    tr.cam_id = 1
-    tr.line_orientation = "vertical"
-    tr.line_ratio = 0.5
-    tr.groups = ["person"]
-    tr.in_counts = {"person": 0}
-    tr.out_counts = {"person": 0}
-    tr.key_in = "person_tracker:cam:1:in"
-    tr.key_out = "person_tracker:cam:1:out"
-    tr.redis = r
-    tr.cfg = {}
+    tr = TrackerStub(redis=r)
     trackers = {1: tr}
 
-    async def run_test():
-        task = asyncio.create_task(counter_config_listener(r, trackers))
-        await asyncio.sleep(0.05)
-        r.hset(
-            "cam:1:line",
-            mapping={"x1": 0.0, "y1": 0.0, "x2": 1.0, "y2": 1.0, "orientation": "horizontal"},
-        )
-        r.sadd("cam:1:vehicle_classes", "car")
-        r.publish("counter.config", "cam:1")
-        await asyncio.sleep(0.1)
-        task.cancel()
-        with suppress(asyncio.CancelledError):
-            await task
-
-    asyncio.run(run_test())
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    processed = asyncio.Event()
+    apply = tm._apply_counter_config
+
+    def apply_and_signal(*args):
+        apply(*args)
+        loop.call_soon_threadsafe(processed.set)
+
+    monkeypatch.setattr(tm, "_apply_counter_config", apply_and_signal)
+    task = loop.create_task(counter_config_listener(r, trackers, ready))
+    await asyncio.wait_for(ready.wait(), 1)
+    r.hset(
+        "cam:1:line",
+        mapping={"x1": 0.0, "y1": 0.0, "x2": 1.0, "y2": 0.5, "orientation": "horizontal"},
+    )
+    r.sadd("cam:1:vehicle_classes", "car")
+    r.publish("counter.config", "cam:1")
+    await asyncio.wait_for(processed.wait(), 2)
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
     assert tr.line_orientation == "horizontal"
+    assert tr.line_ratio == 0.25
     assert "person" in tr.groups and "vehicle" in tr.groups
@@ -1,5 +1,8 @@
 import importlib
 
+import numpy as np
+import pytest
+
 counting = importlib.import_module("app.vision.counting")
 
 
@@ -10,6 +13,15 @@ def test_side_of_line():
     assert counting.side_of_line((-1, 0, 1, 2), line) == 0
 
 
+def test_side_of_line_batch():
+    rng = np.random.default_rng(0)
+    boxes = rng.uniform(-10, 10, size=(1024, 4)).astype(np.float32)
+    boxes[:8, 0] = -boxes[:8, 2]  # centres on the line
+    line = (0, 0, 0, 2)
+    expected = np.array([counting.side_of_line(b, line) for b in boxes.tolist()], dtype=np.int8)
+    np.testing.assert_array_equal(counting.side_of_line_batch(boxes, line), expected)
+
+
 def test_cross_events():
     assert counting.cross_events(-1, 1) == ["in"]
     assert counting.cross_events(1, -1) == ["out"]
@@ -30,3 +42,34 @@ def test_count_update_single_cross():
     tracks = {1: {"bbox": (1, -1, 2, 1), "group": "person", "ts_ms": 2}}
     state, events = counting.count_update(state, tracks, line_cfg)
     assert events == []
+
+
+@pytest.mark.parametrize("offset", [-1, 0], ids=["loop", "batch"])
+def test_count_update_threshold_parity(monkeypatch, offset):
+    n = counting.BATCH_SIDE_MIN_TRACKS + offset
+    rng = np.random.default_rng(n)
+    line = (0, 0, 0, 2)
+    line_cfg = {"id": "L1", "line": line}
+    before = rng.uniform(-10, 10, size=(n, 4)).tolist()
+    after = rng.uniform(-10, 10, size=(n, 4)).tolist()
+    expected = [
+        tid
+        for tid, (a, b) in enumerate(zip(before, after))
+        if counting.cross_events(counting.side_of_line(a, line), counting.side_of_line(b, line))
+    ]
+    assert expected
+    batch_calls = []
+    batch = counting.side_of_line_batch
+    monkeypatch.setattr(
+        counting, "side_of_line_batch", lambda *a: batch_calls.append(1) or batch(*a)
+    )
+
+    state, _ = counting.count_update(
+        {}, {tid: {"bbox": b} for tid, b in enumerate(before)}, line_cfg
+    )
+    _, events = counting.count_update(
+        state, {tid: {"bbox": b} for tid, b in enumerate(after)}, line_cfg
+    )
+
+    assert [e.track_id for e in events] == expected
+    assert len(batch_calls) == (2 if offset >= 0 else 0)
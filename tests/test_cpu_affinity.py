@@ -1,18 +1,30 @@
-from unittest.mock import MagicMock
-
 import psutil
 
 from utils import cpu as cpu_utils
 
 
+# FakeProcess class records the affinity it is asked to apply
+class FakeProcess:
+    def __init__(self):
+        self.calls = []
+
+    def cpu_affinity(self, cpus):
+        self.calls.append(cpus)
+
+
 def test_cpu_affinity(monkeypatch):
     cfg = {"cpu_limit_percent": 25}
-    fake_process = MagicMock()
+    fake_process = FakeProcess()
+    cv2_threads = []
+    torch_threads = []
     monkeypatch.setattr(psutil, "Process", lambda: fake_process)
     monkeypatch.setattr(cpu_utils.os, "cpu_count", lambda: 8)
-    monkeypatch.setattr(cpu_utils.cv2, "setNumThreads", MagicMock())
+    monkeypatch.setattr(cpu_utils.cv2, "setNumThreads", cv2_threads.append, raising=False)
     if cpu_utils.torch is not None:
-        monkeypatch.setattr(cpu_utils.torch, "set_num_threads", MagicMock())
+        monkeypatch.setattr(cpu_utils.torch, "set_num_threads", torch_threads.append)
     cpu_utils.apply_thread_limits(cfg)
     expected = max(1, int(8 * 25 / 100))
-    fake_process.cpu_affinity.assert_called_once_with(list(range(expected)))
+    assert fake_process.calls == [list(range(expected))]
+    assert cv2_threads == [expected]
+    if cpu_utils.torch is not None:
+        assert torch_threads == [expected]
@@ -1,15 +1,12 @@
-import asyncio
-import sys
-
 import numpy as np
+import pytest
 from starlette.requests import Request
 
-sys.modules.setdefault(
-    "cv2", type("cv2", (), {"imencode": lambda *a, **k: (True, np.array([0], dtype=np.uint8))})
-)
-
+# cv2 (with imencode) is stubbed in conftest before any router import
 from routers.dashboard import stream_preview
 
+pytestmark = pytest.mark.anyio
+
 
 class DummyProc:
     def __init__(self):
@@ -30,16 +27,13 @@ class DummyTracker:
         self.proc = DummyProc()
 
 
-def test_stream_preview_proc_kill(monkeypatch):
+async def test_stream_preview_proc_kill(monkeypatch):
     tracker = DummyTracker()
     monkeypatch.setattr("routers.dashboard.require_roles", lambda request, roles: {})
 
-    async def _run():
-        req = Request({"type": "http", "session": {"user": {"role": "viewer"}}})
-        resp = await stream_preview(1, req, {1: tracker})
-        gen = resp.body_iterator
-        await gen.__anext__()
-        await gen.aclose()
-        assert tracker.proc.killed
-
-    asyncio.run(_run())
+    req = Request({"type": "http", "session": {"user": {"role": "viewer"}}})
+    resp = await stream_preview(1, req, {1: tracker})
+    gen = resp.body_iterator
+    await gen.__anext__()
+    await gen.aclose()
+    assert tracker.proc.killed
@@ -1,15 +1,12 @@
-import asyncio
-import sys
-import types
-
 import numpy as np
+import pytest
 from starlette.requests import Request
 
-cv2_stub = sys.modules.setdefault("cv2", types.SimpleNamespace())
-cv2_stub.imencode = lambda *a, **k: (True, np.array([0], dtype=np.uint8))
-
+# cv2 (with imencode) is stubbed in conftest before any router import
 from routers.dashboard import stream_preview
 
+pytestmark = pytest.mark.anyio
+
 
 class DummyTracker:
     def __init__(self):
@@ -21,16 +18,13 @@ class DummyTracker:
         self.restart_capture = False
 
 
-def test_stream_preview_returns_frame(monkeypatch):
+async def test_stream_preview_returns_frame(monkeypatch):
     tracker = DummyTracker()
     monkeypatch.setattr("routers.dashboard.require_roles", lambda request, roles: {})
 
-    async def _run() -> None:
-        req = Request({"type": "http", "session": {"user": {"role": "viewer"}}})
-        resp = await stream_preview(1, req, {1: tracker})
-        gen = resp.body_iterator
-        chunk = await gen.__anext__()
-        assert b"--frame" in chunk
-        await gen.aclose()
-
-    asyncio.run(_run())
+    req = Request({"type": "http", "session": {"user": {"role": "viewer"}}})
+    resp = await stream_preview(1, req, {1: tracker})
+    gen = resp.body_iterator
+    chunk = await gen.__anext__()
+    assert b"--frame" in chunk
+    await gen.aclose()
@@ -1,6 +1,5 @@
 """Tests for debug camera page and update."""
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -12,6 +11,8 @@ sys.path.insert(0, str(ROOT))
 from routers import debug
 from utils.redis_facade import RedisFacade
 
+pytestmark = pytest.mark.anyio
+
 
 class DummyRequest:
     def __init__(self, data=None):
@@ -80,7 +81,7 @@ class DummyTracker:
     "redis_cls,summary",
     [(DummyRedis, "fail"), (DummyRedisStr, "ok")],
 )
-def test_debug_camera_page(redis_cls, summary):
+async def test_debug_camera_page(redis_cls, summary):
     trackers = {1: DummyTracker()}
     cams = [{"id": 1, "name": "cam1"}]
 
@@ -99,7 +100,7 @@ def test_debug_camera_page(redis_cls, summary):
     cameras.rtsp_connectors = {1: FakeConn()}
 
     redis = RedisFacade(redis_cls())
-    cam_info = asyncio.run(debug._collect_cam_info(cams, trackers, redis, "secret"))
+    cam_info = await debug._collect_cam_info(cams, trackers, redis, "secret")
     cam_ctx = cam_info[0]
     assert cam_ctx["pipeline"] == "orig"
     assert cam_ctx["backend"] == "ffmpeg"
@@ -110,12 +111,12 @@ def test_debug_camera_page(redis_cls, summary):
 
 
 @pytest.mark.parametrize("cam_id", [1, "1"])
-def test_debug_camera_update_camid(cam_id):
+async def test_debug_camera_update_camid(cam_id):
     tr = DummyTracker()
     trackers = {1: tr}
     req = DummyRequest({"cam_id": cam_id, "rtsp_transport": "udp"})
-    resp = asyncio.run(
-        debug.debug_camera_update(req, trackers_map=trackers, redisfx=RedisFacade(DummyRedisHSet()))
+    resp = await debug.debug_camera_update(
+        req, trackers_map=trackers, redisfx=RedisFacade(DummyRedisHSet())
     )
     assert tr.rtsp_transport == "udp"
     assert tr.cfg["pipeline"] == "orig"
@@ -125,12 +126,12 @@ def test_debug_camera_update_camid(cam_id):
     assert resp["pipeline"] == "orig"
 
 
-def test_debug_camera_update_pipeline():
+async def test_debug_camera_update_pipeline():
     tr = DummyTracker()
     trackers = {1: tr}
     req = DummyRequest({"cam_id": 1, "rtsp_transport": "udp", "pipeline": "pipe1"})
-    resp = asyncio.run(
-        debug.debug_camera_update(req, trackers_map=trackers, redisfx=RedisFacade(DummyRedisHSet()))
+    resp = await debug.debug_camera_update(
+        req, trackers_map=trackers, redisfx=RedisFacade(DummyRedisHSet())
     )
     assert tr.rtsp_transport == "udp"
     assert tr.pipeline == "pipe1"
@@ -141,14 +142,12 @@ def test_debug_camera_update_pipeline():
     assert resp["restarting"] is True
 
 
-def test_debug_camera_update_resolution():
+async def test_debug_camera_update_resolution():
     tr = DummyTracker()
     trackers = {1: tr}
     redis = DummyRedisHSet()
     req = DummyRequest({"cam_id": 1, "resolution": "800x600"})
-    resp = asyncio.run(
-        debug.debug_camera_update(req, trackers_map=trackers, redisfx=RedisFacade(redis))
-    )
+    resp = await debug.debug_camera_update(req, trackers_map=trackers, redisfx=RedisFacade(redis))
     assert tr.resolution == "800x600"
     assert tr.cfg["resolution"] == "800x600"
     assert tr.restart_capture is True
@@ -1,20 +1,4 @@
 import asyncio
-import sys
-import types
-
-tracker_mod = types.ModuleType("modules.tracker")
-
-
-class PersonTracker:  # minimal stub for type checking
-    pass
-
-
-tracker_mod.PersonTracker = PersonTracker
-modules_pkg = types.ModuleType("modules")
-modules_pkg.tracker = tracker_mod
-sys.modules.setdefault("modules", modules_pkg)
-sys.modules.setdefault("modules.tracker", tracker_mod)
-sys.modules.setdefault("cv2", types.ModuleType("cv2"))
 
 from routers.detections import _build_payload
 
@@ -2,20 +2,21 @@
 
 from pathlib import Path
 
-import fakeredis
 import pytest
 from fastapi import FastAPI
 from fastapi.templating import Jinja2Templates
 from fastapi.testclient import TestClient
 
+from routers import feedback
 from routers.feedback import router
 
 
-@pytest.fixture()
-def client():
+@pytest.fixture(scope="module")
+def client(fake_redis):
+    # fake_redis sits on the shared server that conftest flushes around each test
     app = FastAPI()
     app.state.config = {}
-    app.state.redis_client = fakeredis.FakeRedis(decode_responses=True)
+    app.state.redis_client = fake_redis
     app.state.templates = Jinja2Templates(
         directory=str(Path(__file__).resolve().parents[1] / "templates")
     )
@@ -50,8 +51,9 @@ def test_submit_feedback_rejects_non_image(client):
     assert resp.status_code == 400
 
 
-def test_submit_feedback_rejects_large_file(client):
-    big = b"0" * (5 * 1024 * 1024 + 1)
+def test_submit_feedback_rejects_large_file(client, monkeypatch):
+    monkeypatch.setattr(feedback, "MAX_ATTACHMENT_BYTES", 1024)
+    big = b"0" * 1025
     data = _base_data()
     files = [("attachments", ("big.png", big, "image/png"))]
     resp = client.post("/feedback", data=data, files=files)
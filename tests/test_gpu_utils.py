@@ -1,5 +1,6 @@
 import sys
 import types
+from functools import lru_cache
 from unittest import mock
 
 import pytest
@@ -7,6 +8,8 @@ import pytest
 import utils.gpu as gpu
 
 
+# utils.gpu only reads the fake, so one instance per argument combination is shared
+@lru_cache(maxsize=None)
 def _make_torch(
     is_cuda_available: bool,
     *,
@@ -37,10 +40,12 @@ def _make_torch(
     return types.SimpleNamespace(**attrs)
 
 
-def _capture_logger():
+@pytest.fixture(scope="module")
+def _log_records():
     records: list[str] = []
-    handler_id = gpu.logger.add(lambda msg: records.append(msg), format="{message}")
-    return records, handler_id
+    handler_id = gpu.logger.add(records.append, format="{message}")
+    yield records
+    gpu.logger.remove(handler_id)
 
 
 @pytest.fixture(autouse=True)
@@ -49,10 +54,10 @@ def _clear_ort_cache():
     yield
 
 
-def _capture_logger():
-    records: list[str] = []
-    handler_id = gpu.logger.add(lambda msg: records.append(msg), format="{message}")
-    return records, handler_id
+@pytest.fixture
+def records(_log_records):
+    _log_records.clear()
+    return _log_records
 
 
 def test_probe_cuda_success():
@@ -87,14 +92,10 @@ def test_get_device_cpu_fallback(monkeypatch):
     assert dev.type == "cpu"
 
 
-def test_get_device_logs_details(monkeypatch):
+def test_get_device_logs_details(monkeypatch, records):
     fake_torch = _make_torch(False)
     monkeypatch.setattr(gpu, "torch", fake_torch)
-    records, handler = _capture_logger()
-    try:
-        gpu.get_device()
-    finally:
-        gpu.logger.remove(handler)
+    gpu.get_device()
     text = " ".join(records)
     assert "is_available=False" in text
     assert "device_count=0" in text
@@ -121,20 +122,16 @@ def test_get_device_memory_threshold(monkeypatch):
     assert dev.type == "cpu"
 
 
-def test_get_device_name_probe_failure(monkeypatch):
+def test_get_device_name_probe_failure(monkeypatch, records):
     fake_torch = _make_torch(True, name_error=True)
     monkeypatch.setattr(gpu, "torch", fake_torch)
-    records, handler = _capture_logger()
-    try:
-        dev = gpu.get_device()
-    finally:
-        gpu.logger.remove(handler)
+    dev = gpu.get_device()
     assert dev.type == "cpu"
     text = " ".join(records)
     assert "probe_error=boom" in text
 
 
-def test_get_device_logs_onnxruntime(monkeypatch):
+def test_get_device_logs_onnxruntime(monkeypatch, records):
     fake_torch = _make_torch(False)
     monkeypatch.setattr(gpu, "torch", fake_torch)
     fake_ort = types.SimpleNamespace(
@@ -142,29 +139,25 @@ def test_get_device_logs_onnxruntime(monkeypatch):
         get_available_providers=lambda: ["CPUExecutionProvider"],
     )
     monkeypatch.setitem(sys.modules, "onnxruntime", fake_ort)
-    records, handler = _capture_logger()
     try:
         gpu.get_device()
     finally:
-        gpu.logger.remove(handler)
         monkeypatch.delitem(sys.modules, "onnxruntime", raising=False)
     text = " ".join(records)
     assert "ONNXRuntime providers" in text
     assert "ONNXRuntime running on CPU" in text
 
 
-def test_configure_onnxruntime_cpu(monkeypatch):
+def test_configure_onnxruntime_cpu(monkeypatch, records):
     fake_ort = types.SimpleNamespace(
         set_default_providers=lambda providers: None,
         get_available_providers=lambda: ["CPUExecutionProvider"],
     )
     monkeypatch.setitem(sys.modules, "onnxruntime", fake_ort)
     cfg: dict = {}
-    records, handler = _capture_logger()
     try:
         provider = gpu.configure_onnxruntime(cfg)
     finally:
-        gpu.logger.remove(handler)
         monkeypatch.delitem(sys.modules, "onnxruntime", raising=False)
     text = " ".join(records)
     assert provider == "CPUExecutionProvider"
@@ -173,7 +166,7 @@ def test_configure_onnxruntime_cpu(monkeypatch):
     assert "running on CPU" in text
 
 
-def test_configure_onnxruntime_gpu(monkeypatch):
+def test_configure_onnxruntime_gpu(monkeypatch, records):
     fake_ort = types.SimpleNamespace(
         set_default_providers=lambda providers: None,
         get_available_providers=lambda: [
@@ -183,11 +176,9 @@ def test_configure_onnxruntime_gpu(monkeypatch):
     )
     monkeypatch.setitem(sys.modules, "onnxruntime", fake_ort)
     cfg: dict = {}
-    records, handler = _capture_logger()
     try:
         provider = gpu.configure_onnxruntime(cfg)
     finally:
-        gpu.logger.remove(handler)
         monkeypatch.delitem(sys.modules, "onnxruntime", raising=False)
     text = " ".join(records)
     assert provider == "CUDAExecutionProvider"
@@ -195,14 +186,10 @@ def test_configure_onnxruntime_gpu(monkeypatch):
     assert "GPU acceleration enabled" in text
 
 
-def test_get_device_without_torch_version(monkeypatch):
+def test_get_device_without_torch_version(monkeypatch, records):
     fake_torch = _make_torch(False, with_version=False)
     monkeypatch.setattr(gpu, "torch", fake_torch)
-    records, handler = _capture_logger()
-    try:
-        dev = gpu.get_device()
-    finally:
-        gpu.logger.remove(handler)
+    dev = gpu.get_device()
     assert dev.type == "cpu"
     text = " ".join(records)
     assert "torch_cuda=unknown" in text
@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+import fakeredis
+
+import startup
+
+
+def test_tracker_init_workers_bounds(monkeypatch):
+    monkeypatch.setattr(startup.os, "cpu_count", lambda: 4)
+    assert startup._tracker_init_workers(None, 6, {}) == 6
+    # fast starts stay fully parallel, as without a recorded median
+    assert startup._tracker_init_workers(200, 16, {}) == 16
+    assert startup._tracker_init_workers(1000, 6, {}) == 6
+    # 4 CPUs * 10s budget / 20s per start leaves room for 2 parallel starts
+    assert startup._tracker_init_workers(20000, 6, {}) == 2
+    # very slow starts still make progress one at a time
+    assert startup._tracker_init_workers(60000, 6, {}) == 1
+
+
+def test_init_trackers_records_median(monkeypatch):
+    r = fakeredis.FakeRedis(decode_responses=True)
+    r.set(startup.TRACKER_INIT_KEY, 20000)
+    monkeypatch.setattr(startup.os, "cpu_count", lambda: 2)
+    active = 0
+    peak = 0
+
+    def fake_start(cam, cfg, trackers, redis_client):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        time.sleep(0.01)
+        active -= 1
+        return None
+
+    monkeypatch.setattr(startup, "start_tracker", fake_start)
+    monkeypatch.setattr(startup, "start_watchdog", lambda trackers: None)
+    cams = [{"id": i} for i in range(6)]
+
+    asyncio.run(startup.init_trackers(cams, {}, {}, r, "config.json"))
+
+    assert peak <= 1
+    assert 0 <= int(r.get(startup.TRACKER_INIT_KEY)) < 20000
@@ -0,0 +1,39 @@
+import asyncio
+from types import SimpleNamespace
+
+import modules.detectors as detectors
+import modules.registry as registry
+import startup
+
+
+class _Detector:
+    def __init__(self, weights, device=None):
+        self.weights = weights
+
+
+def _run(monkeypatch, cams):
+    loaded: list[str] = []
+    monkeypatch.setattr(startup, "get_device", lambda device=None: SimpleNamespace(type="cuda"))
+    monkeypatch.setattr(startup, "get_yolo", lambda name, device: loaded.append(name))
+    monkeypatch.setattr(detectors, "BasicDetector", _Detector)
+    monkeypatch.setattr(detectors, "PPEDetector", _Detector)
+    monkeypatch.setattr(registry, "_detectors", {})
+    cfg = {"person_model": "person.pt", "plate_model": "plate.pt", "ppe_model": "ppe.pt"}
+    asyncio.run(startup.preload_models(cfg, cams))
+    return loaded, registry._detectors
+
+
+def test_preload_skips_plate_and_ppe_for_person_only(monkeypatch):
+    loaded, registered = _run(monkeypatch, [{"id": 1, "tasks": ["in_count", "out_count"]}])
+    assert loaded == ["person.pt"]
+    assert set(registered) == {"basic"}
+
+
+def test_preload_loads_plate_and_ppe_when_requested(monkeypatch):
+    cams = [
+        {"id": 1, "tasks": ["in_count", "number_plate"]},
+        {"id": 2, "tasks": ["helmet"]},
+    ]
+    loaded, registered = _run(monkeypatch, cams)
+    assert sorted(loaded) == ["person.pt", "plate.pt"]
+    assert set(registered) == {"basic", "ppe"}
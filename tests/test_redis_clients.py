@@ -9,6 +9,7 @@ from utils import redis as redis_utils
 def test_get_sync_client_in_loop(monkeypatch):
     fake = fakeredis.FakeRedis(decode_responses=True)
     monkeypatch.setattr(redis_utils.redis_sync.Redis, "from_url", lambda *a, **k: fake)
+    redis_utils._get_sync_client.cache_clear()
 
     async def run():
         client = redis_utils.get_sync_client()
@@ -17,6 +18,25 @@ def test_get_sync_client_in_loop(monkeypatch):
 
     result = asyncio.run(run())
     assert result == "v"
+    redis_utils._get_sync_client.cache_clear()
+
+
+def test_get_sync_client_reuses_client(monkeypatch):
+    calls = []
+
+    def fake_from_url(url, **kwargs):
+        calls.append(url)
+        return fakeredis.FakeRedis(decode_responses=True)
+
+    monkeypatch.setattr(redis_utils.redis_sync.Redis, "from_url", fake_from_url)
+    redis_utils._get_sync_client.cache_clear()
+    try:
+        first = redis_utils._get_sync_client("redis://example:6379/0")
+        assert redis_utils._get_sync_client("redis://example:6379/0") is first
+        assert redis_utils._get_sync_client("redis://example:6379/1") is not first
+        assert calls == ["redis://example:6379/0", "redis://example:6379/1"]
+    finally:
+        redis_utils._get_sync_client.cache_clear()
 
 
 def test_get_client_in_loop(monkeypatch):
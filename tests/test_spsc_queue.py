@@ -0,0 +1,40 @@
+import queue
+import threading
+
+import pytest
+
+from modules.tracker.spsc import SPSCQueue
+
+
+def test_spsc_queue_fifo_and_bounds():
+    q = SPSCQueue(maxsize=2)
+    assert q.empty() and not q.full()
+    q.put(1)
+    q.put_nowait(2)
+    assert q.full() and q.qsize() == 2
+    with pytest.raises(queue.Full):
+        q.put(3, timeout=0.01)
+    assert q.get() == 1
+    assert q.get_nowait() == 2
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.01)
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+
+def test_spsc_queue_unbounded_by_default():
+    q = SPSCQueue()
+    for i in range(100):
+        q.put_nowait(i)
+    assert not q.full()
+    assert q.qsize() == 100
+
+
+def test_spsc_queue_wakes_blocked_consumer():
+    q = SPSCQueue(maxsize=1)
+    got: list[int] = []
+    consumer = threading.Thread(target=lambda: got.append(q.get(timeout=2)))
+    consumer.start()
+    q.put(42)
+    consumer.join(timeout=2)
+    assert got == [42]
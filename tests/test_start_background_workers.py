@@ -0,0 +1,44 @@
+import asyncio
+from types import SimpleNamespace
+
+import startup
+
+
+def test_worker_setup_runs_inline(monkeypatch):
+    started: list[str] = []
+
+    async def _noop(*a, **k):
+        return None
+
+    async def _no_trackers(*a, **k):
+        return []
+
+    async def _listener(*a, **k):
+        await asyncio.Event().wait()
+
+    async def _alert(app, cfg, r):
+        started.append("alert")
+
+    async def _ppe(app, cfg, trackers, r):
+        raise RuntimeError("no gpu")
+
+    # the session ``client`` fixture stubs out ``asyncio.create_task``
+    monkeypatch.setattr(asyncio, "create_task", asyncio.tasks.create_task)
+    monkeypatch.setattr(startup, "preload_models", _noop)
+    monkeypatch.setattr(startup, "init_trackers", _no_trackers)
+    monkeypatch.setattr(startup, "counter_config_listener", _listener)
+    monkeypatch.setattr(startup, "alert_worker", _alert)
+    monkeypatch.setattr(startup, "ppe_worker", _ppe)
+
+    app = SimpleNamespace(state=SimpleNamespace(config_path="config.json"))
+
+    async def _run():
+        tasks = await startup.start_background_workers(app, {}, [], {}, None)
+        names = [t.get_name() for t in tasks]
+        for t in tasks:
+            t.cancel()
+        return names
+
+    names = asyncio.run(_run())
+    assert started == ["alert"]
+    assert names == ["counter-config-listener"]
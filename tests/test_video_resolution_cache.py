@@ -1,5 +1,6 @@
 """Tests for cached stream resolution probing."""
 
+import asyncio
 import json
 import types
 
@@ -71,3 +72,23 @@ def test_get_stream_resolution_cache_expiry(monkeypatch):
     now[0] += 2
     assert video.get_stream_resolution(url, cache_seconds=1) == (100, 200)
     assert calls["count"] == 2
+
+
+def test_async_resolution_dedupes_concurrent_probes(monkeypatch):
+    video._RES_CACHE.clear()
+    calls = {"count": 0}
+
+    def fake_run(cmd, capture_output, text, check, timeout):
+        calls["count"] += 1
+        data = {"streams": [{"width": 100, "height": 200}]}
+        return types.SimpleNamespace(stdout=json.dumps(data))
+
+    monkeypatch.setattr(video.subprocess, "run", fake_run)
+
+    async def run():
+        return await asyncio.gather(
+            *(video.async_get_stream_resolution("rtsp://example") for _ in range(5))
+        )
+
+    assert asyncio.run(run()) == [(100, 200)] * 5
+    assert calls["count"] == 1
@@ -55,15 +55,14 @@ def get_logger(name: str) -> logging.Logger:
 
 
 import json
-import re
 import time
 
-_CRED_RE = re.compile(r"(?<=://)([^:@\s]+):([^@/\s]+)@")
+from .url import mask_credentials
 
 
 def mask_uri(uri: str) -> str:
     """Return *uri* with credentials redacted."""
-    return _CRED_RE.sub("***:***@", uri)
+    return mask_credentials(uri)
 
 
 def log_capture_event(cam, msg, lvl: str = "info", **extras) -> None:
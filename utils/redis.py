@@ -50,6 +50,93 @@ def trim_sorted_set_sync(
         asyncio.run(res)
 
 
+def ppe_status_key(status: str) -> str:
+    """Return the sorted set mirroring ``ppe_logs`` entries with ``status``.
+
+    Writers add each PPE log to both ``ppe_logs`` and its per-status set so
+    readers interested in one status can range-query it without decoding and
+    filtering every entry in the window, once :func:`backfill_ppe_status_sets`
+    has run.
+    """
+    return f"ppe_logs:{status}"
+
+
+# set once every ``ppe_logs`` entry has been copied into its per-status set
+PPE_STATUS_SETS_READY = "ppe_status_sets_ready"
+
+
+def record_ppe_log(
+    client: redis_sync.Redis,
+    raw: str,
+    status: str,
+    ts: int,
+    retention_secs: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> None:
+    """Add ``raw`` to ``ppe_logs`` and its per-status set in one round trip.
+
+    Both sets are trimmed to the same retention window and, when ``limit`` is
+    given, to the newest ``limit`` entries.
+    """
+    pipe = client.pipeline(transaction=False)
+    for key in ("ppe_logs", ppe_status_key(status)):
+        pipe.zadd(key, {raw: ts})
+        trim_sorted_set_sync(pipe, key, ts, retention_secs)
+        if limit is not None:
+            pipe.zremrangebyrank(key, 0, -limit - 1)
+    pipe.execute()
+
+
+def backfill_ppe_status_sets(client: redis_sync.Redis, batch: int = 500) -> None:
+    """Copy ``ppe_logs`` entries into their per-status sets once.
+
+    Entries logged before the per-status sets existed are only in
+    ``ppe_logs``; readers keep filtering ``ppe_logs`` until
+    :data:`PPE_STATUS_SETS_READY` is set here.
+    """
+    if client.exists(PPE_STATUS_SETS_READY):
+        return
+    pipe = client.pipeline(transaction=False)
+    for n, (raw, ts) in enumerate(client.zscan_iter("ppe_logs", count=batch), 1):
+        try:
+            status = json.loads(raw).get("status")
+        except (json.JSONDecodeError, AttributeError):
+            continue
+        if isinstance(status, str):
+            pipe.zadd(ppe_status_key(status), {raw: ts})
+        if n % batch == 0:
+            pipe.execute()
+    pipe.execute()
+    client.set(PPE_STATUS_SETS_READY, 1)
+
+
+# per-minute PPE status counters outlive any practical alert window
+PPE_COUNT_TTL = 24 * 60 * 60
+# epoch second of the first counted PPE log; later minutes without a bucket had none
+PPE_COUNT_SINCE = "ppe_count_since"
+
+
+def ppe_count_key(status: str, minute: int) -> str:
+    """Return the counter of ``status`` logs recorded during epoch ``minute``."""
+    return f"ppe_count:{status}:{minute}"
+
+
+def incr_ppe_count(client: redis_sync.Redis, status: str, ts: int) -> None:
+    """Bump the per-minute counter for ``status`` at ``ts``.
+
+    Alert rules sum these buckets to decide whether a threshold can have been
+    reached before decoding any log entries. The first call also records
+    :data:`PPE_COUNT_SINCE` so readers can tell an empty minute from one that
+    predates the counters.
+    """
+    key = ppe_count_key(status, ts // 60)
+    pipe = client.pipeline(transaction=False)
+    pipe.set(PPE_COUNT_SINCE, ts, nx=True)
+    pipe.incr(key)
+    pipe.expire(key, PPE_COUNT_TTL)
+    pipe.execute()
+
+
 # Backwards compatibility alias for deprecated name
 trim_sorted_set_async = trim_sorted_set
 
@@ -88,12 +175,21 @@ async def get_client(url: Optional[str] = None) -> redis_async.Redis:
 
 
 def get_sync_client(url: Optional[str] = None) -> redis_sync.Redis:
-    """Return a synchronous Redis client."""
+    """Return a synchronous Redis client.
+
+    Clients are cached per URL so repeated calls share one connection pool
+    instead of opening a new socket each time.
+    """
     url = (
         url or shared_config.get("redis_url") or os.getenv("REDIS_URL", "redis://localhost:6379/0")
     )
+    return _get_sync_client(url)
+
+
+@lru_cache(maxsize=8)
+def _get_sync_client(url: str) -> redis_sync.Redis:
     try:
-        client = redis_sync.Redis.from_url(url, decode_responses=True)
+        client = redis_sync.Redis.from_url(url, decode_responses=True, socket_keepalive=True)
         client.ping()
     except (RedisError, OSError) as e:
         logger.error("Failed to connect to Redis at {}: {}", url, e)
@@ -7,6 +7,7 @@ import json
 import logging
 import subprocess
 import time
+import weakref
 from collections import OrderedDict
 
 from config import config as app_config
@@ -18,11 +19,24 @@ logger = logging.getLogger(__name__)
 _RES_CACHE: OrderedDict[str, tuple[tuple[int, int], float]] = OrderedDict()
 _CACHE_MAX = 128
 register_cache("resolution", _RES_CACHE)
+# URL -> lock held while a probe for that URL is in flight
+_PROBE_LOCKS: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
 
 
 _FALLBACK_TTL = 120
 
 
+def _cached_resolution(url: str, now: float) -> tuple[int, int] | None:
+    """Return the unexpired cached resolution for ``url`` or ``None``."""
+    cached = _RES_CACHE.get(url)
+    if cached:
+        if cached[1] > now:
+            _RES_CACHE.move_to_end(url)
+            return cached[0]
+        _RES_CACHE.pop(url, None)
+    return None
+
+
 def get_stream_resolution(
     url: str,
     *,
@@ -46,12 +60,9 @@ def get_stream_resolution(
     if invalidate:
         _RES_CACHE.pop(url, None)
     else:
-        cached = _RES_CACHE.get(url)
+        cached = _cached_resolution(url, now)
         if cached:
-            if cached[1] > now:
-                _RES_CACHE.move_to_end(url)
-                return cached[0]
-            _RES_CACHE.pop(url, None)
+            return cached
     cmd = ["ffprobe"]
     if url.startswith("rtsp://"):
         cmd.extend(["-rtsp_transport", "tcp"])
@@ -135,18 +146,32 @@ async def async_get_stream_resolution(
 
     Executes the blocking probe in a thread and returns ``(640, 480)`` on
     failure or timeout. The ``timeout`` and ``fallback_ttl`` parameters are
-    forwarded to the underlying probe.
+    forwarded to the underlying probe. Cache hits are answered without a
+    thread hop, and concurrent calls for the same URL share a single probe.
     """
     fallback = (640, 480)
+    if not invalidate:
+        cached = _cached_resolution(url, time.monotonic())
+        if cached:
+            return cached
+    lock = _PROBE_LOCKS.get(url)
+    if lock is None:
+        lock = _PROBE_LOCKS[url] = asyncio.Lock()
     try:
-        return await asyncio.to_thread(
-            get_stream_resolution,
-            url,
-            cache_seconds=cache_seconds,
-            invalidate=invalidate,
-            timeout=timeout,
-            fallback_ttl=fallback_ttl,
-        )
+        async with lock:
+            if not invalidate:
+                # another caller may have probed while we waited
+                cached = _cached_resolution(url, time.monotonic())
+                if cached:
+                    return cached
+            return await asyncio.to_thread(
+                get_stream_resolution,
+                url,
+                cache_seconds=cache_seconds,
+                invalidate=invalidate,
+                timeout=timeout,
+                fallback_ttl=fallback_ttl,
+            )
     except (OSError, RuntimeError, ValueError) as exc:
         logger.warning(
             "async probe failed for %s (%s: %s); falling back to %dx%d",